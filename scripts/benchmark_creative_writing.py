@@ -214,6 +214,13 @@ def export_and_display_results(
                 max_throughput = avg_tps
                 winner_engine = agg.engine_name
         
+        # Group TTFT samples by engine in one pass, keeping only requests
+        # that reported a first-token latency
+        ttft_by_engine: Dict[str, List[float]] = {}
+        for m in metrics_collector.current_collection.parsed_metrics:
+            if m.first_token_latency:
+                ttft_by_engine.setdefault(m.engine_name, []).append(m.first_token_latency)
+        
         for agg in aggregates:
             success_rate = f"{agg.success_rate:.0%}"
             avg_tps = f"{agg.aggregate_tps:.1f}" if agg.aggregate_tps else "N/A"
@@ -222,8 +229,7 @@ def export_and_display_results(
             p95_tps = avg_tps  # Simplified
             
             # TTFT calculation
-            ttft_metrics = [m.first_token_latency for m in metrics_collector.current_collection.parsed_metrics 
-                          if m.engine_name == agg.engine_name and m.first_token_latency]
+            ttft_metrics = ttft_by_engine.get(agg.engine_name)
             avg_ttft = f"{sum(ttft_metrics)/len(ttft_metrics):.3f}s" if ttft_metrics else "N/A"
             
             tokens_out = f"{agg.total_output_tokens:,}" if agg.total_output_tokens else "N/A"
@@ -409,7 +415,8 @@ async def main() -> None:
         console.print(f"[bold]Prompts per target:[/bold] {bench_config.num_requests_per_target}\n")
         
         from rich.prompt import Confirm
-        if not Confirm.ask("Start benchmark?", default=True):
+        # Non-interactive runs (CI, piped stdin) skip the confirmation gate
+        if sys.stdin.isatty() and not Confirm.ask("Start benchmark?", default=True):
             console.print("[yellow]Benchmark cancelled[/yellow]")
             return
         
@@ -350,7 +350,8 @@ async def run_benchmark_tests(
     console.print(f"[bold]Total requests to execute:[/bold] {total_requests}")
     console.print(f"[bold]Prompts per target:[/bold] {config['num_requests']}\n")
     
-    if not Confirm.ask("Start benchmark?", default=True):
+    # Non-interactive runs (CI, piped stdin) skip the confirmation gate
+    if sys.stdin.isatty() and not Confirm.ask("Start benchmark?", default=True):
         console.print("[yellow]Benchmark cancelled[/yellow]")
         return
     
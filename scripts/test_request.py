@@ -319,7 +319,7 @@ async def send_request_with_streaming(
                         f"[bold]Streaming Metrics (Demo):[/bold]\n\n"
                         f"• Tokens displayed: {final_metrics.tokens_received}\n"
                         f"• Simulated rate: {final_metrics.current_token_rate:.1f} tok/s\n"
-                        f"• Performance: {final_metrics.get_performance_level().value}"
+                        f"• Performance: {final_metrics.get_performance_level().name.lower()}"
                     ),
                     title="🎬 Streaming Demo",
                     border_style="cyan",
@@ -7,9 +7,10 @@ for all engine adapters.
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
-from datetime import datetime
+from datetime import datetime, timedelta
 import httpx
 from httpx import AsyncClient, Timeout, Response
 
@@ -377,6 +378,24 @@ class BaseAdapter(ABC):
         
         return response, json_data
     
+    @staticmethod
+    def _monotonic_timestamp(anchor: datetime, anchor_ns: int) -> datetime:
+        """
+        Get the current wall-clock time measured on the monotonic clock.
+        
+        Timestamps are offset from a wall-clock anchor taken together with
+        ``time.monotonic_ns()``, so latencies derived from them (e.g. TTFT)
+        are immune to system clock steps during a request.
+        
+        Args:
+            anchor: Wall-clock time captured at the start of the request
+            anchor_ns: ``time.monotonic_ns()`` captured alongside the anchor
+            
+        Returns:
+            Current time as a datetime on the anchor's timeline
+        """
+        return anchor + timedelta(microseconds=(time.monotonic_ns() - anchor_ns) // 1_000)
+    
     def _create_raw_metrics(
         self, 
         prompt: str, 
@@ -7,6 +7,7 @@ handling Ollama-specific API calls and metrics parsing.
 
 import json
 import logging
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
@@ -308,6 +309,7 @@ class OllamaAdapter(BaseAdapter):
             RequestResult with complete response and metrics
         """
         request_start = datetime.utcnow()
+        request_start_ns = time.monotonic_ns()
         first_token_time = None
         full_response = []
         final_metrics = {}
@@ -358,7 +360,7 @@ class OllamaAdapter(BaseAdapter):
                             
                             # Record first token time
                             if first_token_time is None:
-                                first_token_time = datetime.utcnow()
+                                first_token_time = self._monotonic_timestamp(request_start, request_start_ns)
                             
                             # Call token callback if provided
                             if token_callback:
@@ -373,7 +375,7 @@ class OllamaAdapter(BaseAdapter):
                         self.logger.warning(f"Failed to parse streaming chunk: {line[:100]}")
                         continue
             
-            request_end = datetime.utcnow()
+            request_end = self._monotonic_timestamp(request_start, request_start_ns)
             request_duration_ms = (request_end - request_start).total_seconds() * 1000
             
             # Combine full response
@@ -7,6 +7,7 @@ handling TGI-specific API calls and metrics parsing.
 
 import json
 import logging
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -331,6 +332,7 @@ class TGIAdapter(BaseAdapter):
             RequestResult with complete response and metrics
         """
         request_start = datetime.utcnow()
+        request_start_ns = time.monotonic_ns()
         first_token_time = None
         
         try:
@@ -391,7 +393,7 @@ class TGIAdapter(BaseAdapter):
                                 
                                 # Record first token time
                                 if first_token_time is None:
-                                    first_token_time = datetime.utcnow()
+                                    first_token_time = self._monotonic_timestamp(request_start, request_start_ns)
                                 
                                 accumulated_text += token
                                 token_count += 1
@@ -409,7 +411,7 @@ class TGIAdapter(BaseAdapter):
                         self.logger.warning(f"Failed to parse streaming chunk: {line[:100]}")
                         continue
             
-            request_end = datetime.utcnow()
+            request_end = self._monotonic_timestamp(request_start, request_start_ns)
             request_duration_ms = (request_end - request_start).total_seconds() * 1000
             
             # Get final response text
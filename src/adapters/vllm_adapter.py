@@ -7,6 +7,7 @@ handling vLLM's OpenAI-compatible API calls and metrics parsing.
 
 import logging
 import json
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
@@ -220,6 +221,7 @@ class VLLMAdapter(BaseAdapter):
             RequestResult with response and metrics
         """
         request_start = datetime.utcnow()
+        request_start_ns = time.monotonic_ns()
         first_token_time = None
         prompt_processing_end = None
         
@@ -260,15 +262,16 @@ class VLLMAdapter(BaseAdapter):
             # Handle streaming vs non-streaming requests
             if use_streaming:
                 response_data, first_token_time, prompt_processing_end = await self._handle_streaming_request(
-                    endpoint, request_data, request_start
+                    endpoint, request_data, request_start, request_start_ns
                 )
             else:
                 response_data = await self._post_json(endpoint, request_data)
                 # For non-streaming, estimate prompt processing time based on model loading patterns
                 # Typically, model loading + prompt processing takes 10-30% of total time
-                prompt_processing_end = request_start + (datetime.utcnow() - request_start) * 0.2
+                elapsed = self._monotonic_timestamp(request_start, request_start_ns) - request_start
+                prompt_processing_end = request_start + elapsed * 0.2
             
-            request_end = datetime.utcnow()
+            request_end = self._monotonic_timestamp(request_start, request_start_ns)
             request_duration_ms = (request_end - request_start).total_seconds() * 1000
             
             # Extract response text based on endpoint used
@@ -335,7 +338,8 @@ class VLLMAdapter(BaseAdapter):
         self, 
         endpoint: str, 
         request_data: Dict[str, Any], 
-        request_start: datetime
+        request_start: datetime,
+        request_start_ns: Optional[int] = None
     ) -> tuple[Dict[str, Any], Optional[datetime], Optional[datetime]]:
         """
         Handle streaming request to capture first token timing.
@@ -344,10 +348,15 @@ class VLLMAdapter(BaseAdapter):
             endpoint: API endpoint
             request_data: Request payload
             request_start: When request started
+            request_start_ns: Monotonic clock reading taken with request_start
+                (defaults to now)
             
         Returns:
             Tuple of (final_response_data, first_token_time, prompt_processing_end)
         """
+        if request_start_ns is None:
+            request_start_ns = time.monotonic_ns()
+        
         try:
             first_token_time = None
             prompt_processing_end = None
@@ -389,7 +398,7 @@ class VLLMAdapter(BaseAdapter):
                             if "content" in delta and delta["content"]:
                                 # First token received
                                 if first_token_time is None:
-                                    first_token_time = datetime.utcnow()
+                                    first_token_time = self._monotonic_timestamp(request_start, request_start_ns)
                                     # Estimate prompt processing ended just before first token
                                     prompt_processing_end = first_token_time - timedelta(milliseconds=10)
                                 
@@ -450,6 +459,7 @@ class VLLMAdapter(BaseAdapter):
             RequestResult with complete response and metrics
         """
         request_start = datetime.utcnow()
+        request_start_ns = time.monotonic_ns()
         first_token_time = None
         prompt_processing_end = None
         
@@ -539,7 +549,7 @@ class VLLMAdapter(BaseAdapter):
                             if token:
                                 # First token received
                                 if first_token_time is None:
-                                    first_token_time = datetime.utcnow()
+                                    first_token_time = self._monotonic_timestamp(request_start, request_start_ns)
                                     # Estimate prompt processing ended just before first token
                                     prompt_processing_end = first_token_time - timedelta(milliseconds=10)
                                     self.logger.info(f"vLLM first token received: {token[:50]}")
@@ -562,7 +572,7 @@ class VLLMAdapter(BaseAdapter):
                         self.logger.warning(f"Failed to parse vLLM streaming chunk: {line[:100]}")
                         continue
             
-            request_end = datetime.utcnow()
+            request_end = self._monotonic_timestamp(request_start, request_start_ns)
             request_duration_ms = (request_end - request_start).total_seconds() * 1000
             
             # Construct final response in OpenAI format
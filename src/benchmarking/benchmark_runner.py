@@ -40,7 +40,8 @@ class BenchmarkRunner:
     def __init__(
         self,
         console: Optional[Console] = None,
-        dashboard_config: Optional[DashboardConfig] = None
+        dashboard_config: Optional[DashboardConfig] = None,
+        dramatic_mode: bool = False
     ):
         """
         Initialize benchmark runner.
@@ -48,9 +49,12 @@ class BenchmarkRunner:
         Args:
             console: Rich console instance
             dashboard_config: Dashboard configuration
+            dramatic_mode: Pause briefly after each response so the final
+                state stays on screen (adds wall-clock time per request)
         """
         self.console = console or Console()
         self.dashboard = LiveDashboard(config=dashboard_config, console=self.console)
+        self.dramatic_mode = dramatic_mode
     
     async def run(
         self,
@@ -71,18 +75,19 @@ class BenchmarkRunner:
         Returns:
             Dictionary of engine statistics
         """
+        # No interactive terminal: skip all dashboard rendering
+        if not self.console.is_terminal:
+            return await self._run_headless(
+                metrics_collector, targets, prompts, config, parallel=False
+            )
+        
         # Start metrics collection
         metrics_collector.start_collection(config.description)
         
         total_requests = len(targets) * config.num_requests_per_target
         
         # Initialize engine metrics
-        engine_metrics = {}
-        for target in targets:
-            engine_metrics[target.engine_name] = EngineStats(
-                target=config.num_requests_per_target,
-                start_time=time.time()
-            )
+        engine_metrics = self._init_engine_metrics(targets, config)
         
         # Run with live display
         start_time = time.time()
@@ -151,7 +156,8 @@ class BenchmarkRunner:
                                 current_prompt=prompt,
                                 current_response=result.response
                             ))
-                            await asyncio.sleep(0.3)
+                            if self.dramatic_mode:
+                                await asyncio.sleep(0.3)
                             
                             # Update metrics
                             self._update_engine_metrics(engine_metrics[engine_name], result)
@@ -167,7 +173,8 @@ class BenchmarkRunner:
                                 current_prompt=prompt,
                                 current_response=f"❌ Error: {result.error_message[:100]}"
                             ))
-                            await asyncio.sleep(0.3)
+                            if self.dramatic_mode:
+                                await asyncio.sleep(0.3)
                         
                         completed_requests += 1
                         
@@ -189,7 +196,8 @@ class BenchmarkRunner:
                             current_prompt=prompt,
                             current_response=f"❌ Error: {str(e)[:100]}"
                         ))
-                        await asyncio.sleep(0.3)
+                        if self.dramatic_mode:
+                            await asyncio.sleep(0.3)
         
         return engine_metrics
     
@@ -215,18 +223,19 @@ class BenchmarkRunner:
         Returns:
             Dictionary of engine statistics
         """
+        # No interactive terminal: skip all dashboard rendering
+        if not self.console.is_terminal:
+            return await self._run_headless(
+                metrics_collector, targets, prompts, config, parallel=True
+            )
+        
         # Start metrics collection
         metrics_collector.start_collection(config.description)
         
         total_requests = len(targets) * config.num_requests_per_target
         
         # Initialize engine metrics
-        engine_metrics = {}
-        for target in targets:
-            engine_metrics[target.engine_name] = EngineStats(
-                target=config.num_requests_per_target,
-                start_time=time.time()
-            )
+        engine_metrics = self._init_engine_metrics(targets, config)
         
         # Shared state for tracking progress and current responses
         completed_requests = 0
@@ -235,6 +244,9 @@ class BenchmarkRunner:
         # Track current streaming responses for each engine
         current_responses = {target.engine_name: "" for target in targets}
         current_prompts = {target.engine_name: "" for target in targets}
+        # Tokens of in-flight responses; the update loop joins them once per
+        # frame instead of every token re-joining the whole response
+        response_buffers: Dict[str, List[str]] = {target.engine_name: [] for target in targets}
         responses_lock = asyncio.Lock()
         
         # Convert targets to dict format for dashboard
@@ -264,16 +276,13 @@ class BenchmarkRunner:
                     async with responses_lock:
                         current_prompts[engine_name] = prompt[:100] + "..." if len(prompt) > 100 else prompt
                         current_responses[engine_name] = ""
+                        # Accumulated response for this request
+                        accumulated_response = response_buffers[engine_name] = []
                     
-                    # Accumulated response for this request
-                    accumulated_response = []
-                    
-                    # Define token callback for real-time per-token updates
+                    # Token callback only buffers the token; the update loop
+                    # publishes everything buffered since the last frame
                     async def token_callback(token: str) -> None:
                         accumulated_response.append(token)
-                        # Update shared state with new token
-                        async with responses_lock:
-                            current_responses[engine_name] = "".join(accumulated_response)
                     
                     # Send streaming request with real-time token delivery
                     result = await metrics_collector.collect_streaming_request_metrics(
@@ -292,6 +301,7 @@ class BenchmarkRunner:
                         engine_metrics[engine_name].failed += 1
                         # Show error briefly
                         async with responses_lock:
+                            response_buffers[engine_name] = []
                             current_responses[engine_name] = f"❌ {result.error_message[:100]}"
                     
                     # Update global counter
@@ -299,8 +309,10 @@ class BenchmarkRunner:
                         completed_requests += 1
                     
                     # Clear current response after completion
-                    await asyncio.sleep(0.5)  # Brief pause to show final state
+                    if self.dramatic_mode:
+                        await asyncio.sleep(0.5)  # Brief pause to show final state
                     async with responses_lock:
+                        response_buffers[engine_name] = []
                         current_responses[engine_name] = ""
                         current_prompts[engine_name] = ""
                     
@@ -310,8 +322,10 @@ class BenchmarkRunner:
                         completed_requests += 1
                     # Show error
                     async with responses_lock:
+                        response_buffers[engine_name] = []
                         current_responses[engine_name] = f"❌ {str(e)[:100]}"
-                    await asyncio.sleep(0.5)
+                    if self.dramatic_mode:
+                        await asyncio.sleep(0.5)
                 
                 finally:
                     # Mark engine as inactive if done
@@ -327,21 +341,37 @@ class BenchmarkRunner:
                 current_prompts=current_prompts
             ),
             console=self.console,
-            refresh_per_second=10  # Higher refresh rate for smooth streaming
+            auto_refresh=False  # The update loop below drives every refresh
         ) as live:
             # Create tasks for all engines
             engine_tasks = [asyncio.create_task(run_engine_requests(target)) for target in targets]
             
             # Continuous update loop while any task is running
+            last_state = None
             while not all(task.done() for task in engine_tasks):
-                # Update display with current state
+                # Update display with current state, skipping the rebuild
+                # when nothing visible changed since the last frame
                 async with responses_lock:
-                    live.update(self.dashboard.create_display(
-                        targets_dict, engine_metrics, start_time,
-                        total_requests, completed_requests,
-                        current_responses=dict(current_responses),
-                        current_prompts=dict(current_prompts)
-                    ))
+                    # Coalesce tokens buffered since the last frame
+                    for name, buffer in response_buffers.items():
+                        if buffer:
+                            current_responses[name] = "".join(buffer)
+                    
+                    state = (
+                        completed_requests,
+                        round(time.time() - start_time),
+                        tuple(current_responses.values()),
+                        tuple(current_prompts.values()),
+                        tuple((s.completed, s.failed) for s in engine_metrics.values())
+                    )
+                    if state != last_state:
+                        last_state = state
+                        live.update(self.dashboard.create_display(
+                            targets_dict, engine_metrics, start_time,
+                            total_requests, completed_requests,
+                            current_responses=dict(current_responses),
+                            current_prompts=dict(current_prompts)
+                        ), refresh=True)
                 await asyncio.sleep(0.1)  # Update every 100ms
             
             # Wait for all engines to complete
@@ -351,10 +381,95 @@ class BenchmarkRunner:
             live.update(self.dashboard.create_display(
                 targets_dict, engine_metrics, start_time,
                 total_requests, completed_requests
-            ))
+            ), refresh=True)
+        
+        return engine_metrics
+    
+    async def _run_headless(
+        self,
+        metrics_collector: Any,
+        targets: List[BenchmarkTarget],
+        prompts: List[str],
+        config: BenchmarkConfig,
+        parallel: bool
+    ) -> Dict[str, EngineStats]:
+        """
+        Run benchmark without the live dashboard.
+        
+        Used when the console is not an interactive terminal (CI, output
+        piped to a file): no layouts or panels are built and a single log
+        line is emitted per finished request.
+        
+        Args:
+            metrics_collector: Metrics collector instance
+            targets: List of benchmark targets
+            prompts: List of prompts to test
+            config: Benchmark configuration
+            parallel: Run all engines concurrently instead of one by one
+            
+        Returns:
+            Dictionary of engine statistics
+        """
+        metrics_collector.start_collection(config.description)
+        engine_metrics = self._init_engine_metrics(targets, config)
+        num_requests = config.num_requests_per_target
+        
+        async def run_engine_requests(target: BenchmarkTarget) -> None:
+            """Run all requests for a single engine, logging each outcome."""
+            engine_name = target.engine_name
+            stats = engine_metrics[engine_name]
+            
+            for i, prompt in enumerate(prompts[:num_requests]):
+                try:
+                    result = await metrics_collector.collect_streaming_request_metrics(
+                        engine_name,
+                        prompt,
+                        target.model_name,
+                        max_tokens=config.max_tokens,
+                        temperature=config.temperature
+                    )
+                    
+                    if result.success:
+                        stats.completed += 1
+                        self._update_engine_metrics(stats, result)
+                        status = "complete"
+                    else:
+                        stats.failed += 1
+                        status = f"error: {result.error_message[:100]}"
+                        
+                except Exception as e:
+                    stats.failed += 1
+                    status = f"error: {str(e)[:100]}"
+                
+                self.console.log(
+                    f"{engine_name} ({target.model_name}) "
+                    f"request {i + 1}/{num_requests}: {status}"
+                )
+        
+        if parallel:
+            await asyncio.gather(*(run_engine_requests(target) for target in targets))
+        else:
+            for target in targets:
+                await run_engine_requests(target)
         
         return engine_metrics
     
+    def _init_engine_metrics(
+        self,
+        targets: List[BenchmarkTarget],
+        config: BenchmarkConfig
+    ) -> Dict[str, EngineStats]:
+        """Create empty statistics for every target engine."""
+        # New stats objects start a new run for the dashboard's caches
+        self.dashboard.start_run()
+        return {
+            target.engine_name: EngineStats(
+                target=config.num_requests_per_target,
+                start_time=time.time()
+            )
+            for target in targets
+        }
+    
     def _update_engine_metrics(self, stats: EngineStats, result: Any) -> None:
         """Update engine statistics from result with enhanced metrics."""
         if not result.parsed_metrics:
@@ -375,7 +490,7 @@ class BenchmarkRunner:
         if result.parsed_metrics.response_token_rate:
             stats.token_rates.append(result.parsed_metrics.response_token_rate)
             # Calculate running average
-            stats.avg_tps = sum(stats.token_rates) / len(stats.token_rates)
+            stats.avg_tps = stats.get_avg_token_rate()
         
         # Track TTFT (Time to First Token)
         if result.parsed_metrics.first_token_latency:
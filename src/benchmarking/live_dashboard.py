@@ -5,9 +5,13 @@ Provides reusable 3-panel dashboard for tracking benchmark progress
 with live metrics and request/response display.
 """
 
+import bisect
+import operator
 import time
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, ClassVar
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from rich.console import Console
 from rich.panel import Panel
@@ -18,7 +22,38 @@ from rich import box
 from pydantic import BaseModel, Field
 
 
-@dataclass
+# Counters read for every metrics table row, fetched in one call
+_ROW_COUNTERS = operator.attrgetter("completed", "failed", "avg_tps", "total_tokens", "target")
+
+# Shared fallback console, created on first use
+_default_console: Optional[Console] = None
+
+
+def _get_default_console() -> Console:
+    """Get the shared Console used by dashboards created without one."""
+    global _default_console
+    if _default_console is None:
+        _default_console = Console()
+    return _default_console
+
+
+@lru_cache(maxsize=1)
+def _initializing_request_panel() -> Panel:
+    """Get the placeholder request panel shown before the first request starts."""
+    empty_text = Text()
+    empty_text.append("\n", style="")
+    empty_text.append("        Initializing", style="dim italic")
+    empty_text.append("\n\n", style="")
+    return Panel(
+        empty_text,
+        title="[dim]Streaming Response[/dim]",
+        border_style="bright_black",
+        box=box.SIMPLE,
+        padding=(1, 2)
+    )
+
+
+@dataclass(slots=True)
 class EngineStats:
     """Real-time statistics for an engine."""
     completed: int = 0
@@ -35,6 +70,15 @@ class EngineStats:
     # Token/word metrics
     tokens_per_response: list = None  # Token count per response
     words_per_response: list = None  # Word count per response
+    # Running (source list, count, sum) per sample list; a list object is
+    # treated as append-only, and assigning a new list starts over
+    _running_sums: Dict[str, Tuple[list, int, float]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (source list, sorted copy) per sample list for percentiles, grown by insertion
+    _sorted_samples: Dict[str, Tuple[list, list]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         if self.token_rates is None:
@@ -50,57 +94,85 @@ class EngineStats:
         if self.words_per_response is None:
             self.words_per_response = []
     
-    def calculate_percentile(self, values: list, percentile: float) -> Optional[float]:
-        """Calculate percentile from a list of values."""
+    def _running_mean(self, name: str) -> Optional[float]:
+        """Get the mean of a sample list, summing only samples added since the last call."""
+        values = getattr(self, name)
         if not values:
             return None
-        sorted_values = sorted(values)
+        source, count, total = self._running_sums.get(name, (None, 0, 0.0))
+        if source is not values or count > len(values):
+            # The list was replaced or truncated; start over
+            count, total = 0, 0.0
+        if count < len(values):
+            total += sum(values[count:])
+            count = len(values)
+            self._running_sums[name] = (values, count, total)
+        return total / count
+    
+    @staticmethod
+    def _pick_percentile(sorted_values: list, percentile: float) -> Optional[float]:
+        """Pick a percentile from already sorted values."""
+        if not sorted_values:
+            return None
         index = int(len(sorted_values) * percentile / 100)
         return sorted_values[min(index, len(sorted_values) - 1)]
     
+    def calculate_percentile(self, values: list, percentile: float) -> Optional[float]:
+        """Calculate percentile from a list of values."""
+        return self._pick_percentile(sorted(values), percentile)
+    
+    def _sample_percentile(self, name: str, percentile: float) -> Optional[float]:
+        """Get a percentile of a sample list, inserting only new samples into its sorted copy."""
+        values = getattr(self, name)
+        source, sorted_values = self._sorted_samples.get(name, (None, None))
+        if source is not values or len(sorted_values) > len(values):
+            # First call, or the list was replaced or truncated; start over
+            sorted_values = sorted(values)
+            self._sorted_samples[name] = (values, sorted_values)
+        else:
+            for value in values[len(sorted_values):]:
+                bisect.insort(sorted_values, value)
+        return self._pick_percentile(sorted_values, percentile)
+    
     def get_ttft_p95(self) -> Optional[float]:
         """Get p95 TTFT."""
-        return self.calculate_percentile(self.ttft_values, 95)
+        return self._sample_percentile("ttft_values", 95)
     
     def get_ttft_p99(self) -> Optional[float]:
         """Get p99 TTFT."""
-        return self.calculate_percentile(self.ttft_values, 99)
+        return self._sample_percentile("ttft_values", 99)
     
     def get_avg_ttft(self) -> Optional[float]:
         """Get average TTFT."""
-        if not self.ttft_values:
-            return None
-        return sum(self.ttft_values) / len(self.ttft_values)
+        return self._running_mean("ttft_values")
+    
+    def get_avg_token_rate(self) -> Optional[float]:
+        """Get average token rate (tokens/sec)."""
+        return self._running_mean("token_rates")
     
     def get_token_rate_variance(self) -> Optional[float]:
         """Calculate token rate variance (std dev)."""
         if len(self.token_rates) < 2:
             return None
-        mean = sum(self.token_rates) / len(self.token_rates)
+        mean = self.get_avg_token_rate()
         variance = sum((x - mean) ** 2 for x in self.token_rates) / len(self.token_rates)
         return variance ** 0.5  # Standard deviation
     
     def get_avg_inter_token_latency(self) -> Optional[float]:
         """Get average inter-token latency in milliseconds."""
-        if not self.inter_token_latencies:
-            return None
-        return sum(self.inter_token_latencies) / len(self.inter_token_latencies)
+        return self._running_mean("inter_token_latencies")
     
     def get_avg_response_duration(self) -> Optional[float]:
         """Get average response duration in seconds."""
-        if not self.response_durations:
-            return None
-        return sum(self.response_durations) / len(self.response_durations)
+        return self._running_mean("response_durations")
     
     def get_response_duration_p95(self) -> Optional[float]:
         """Get p95 response duration in seconds."""
-        return self.calculate_percentile(self.response_durations, 95)
+        return self._sample_percentile("response_durations", 95)
     
     def get_avg_tokens_per_response(self) -> Optional[float]:
         """Get average tokens per response."""
-        if not self.tokens_per_response:
-            return None
-        return sum(self.tokens_per_response) / len(self.tokens_per_response)
+        return self._running_mean("tokens_per_response")
     
     def get_token_word_ratio(self) -> Optional[float]:
         """
@@ -126,6 +198,19 @@ class EngineStats:
         return sum(ratios) / len(ratios)
 
 
+@dataclass(slots=True, frozen=True)
+class MetricCells:
+    """Pre-formatted metric cells (Rich markup) for one metrics table row."""
+    progress: str
+    throughput: str
+    ttft: str
+    duration: str
+    inter_token: str
+    tokens_per_response: str
+    token_word_ratio: str
+    total_tokens: str
+
+
 class DashboardConfig(BaseModel):
     """Configuration for live dashboard."""
     
@@ -167,6 +252,74 @@ class LiveDashboard:
     3. Metrics Table - Side-by-side comparison
     """
     
+    __slots__ = (
+        "config",
+        "_console",
+        "_idle_panels",
+        "_engine_headers",
+        "_pod_info_texts",
+        "_column_titles",
+        "_last_column_panels",
+        "_active_column_panels",
+        "_engines_layout",
+        "_engines_layout_names",
+        "_engines_layout_panels",
+        "_response_views",
+        "_engine_summaries",
+        "_display_layouts",
+        "_empty_metrics_table",
+        "_metric_cells",
+        "_request_panel",
+    )
+    
+    # Upper bound on memoized idle engine panels (LRU)
+    _IDLE_PANEL_CACHE_SIZE = 128
+    
+    # TTFT color tiers in seconds: each threshold closes the tier before it
+    TTFT_THRESHOLDS: ClassVar[Tuple[float, ...]] = (0.1, 0.2, 0.4)
+    _TTFT_STYLES: ClassVar[Tuple[str, ...]] = ("bold green", "green", "yellow", "white")
+    
+    # Throughput tiers in tokens/sec (higher is better)
+    TPS_THRESHOLDS: ClassVar[Tuple[float, ...]] = (15, 30, 50)
+    _TPS_STYLES: ClassVar[Tuple[str, ...]] = ("white", "yellow", "green", "bold green")
+    
+    # Response duration tiers in seconds
+    DURATION_THRESHOLDS: ClassVar[Tuple[float, ...]] = (5, 15)
+    _DURATION_STYLES: ClassVar[Tuple[str, ...]] = ("bold magenta", "magenta", "white")
+    
+    # Inter-token latency tiers in milliseconds
+    INTER_TOKEN_THRESHOLDS: ClassVar[Tuple[float, ...]] = (20, 40, 80)
+    _INTER_TOKEN_STYLES: ClassVar[Tuple[str, ...]] = ("bold green", "green", "yellow", "white")
+    
+    # Token/word ratio tiers: efficient, good, average, less efficient
+    RATIO_THRESHOLDS: ClassVar[Tuple[float, ...]] = (1.3, 1.5, 1.7)
+    _RATIO_STYLES: ClassVar[Tuple[str, ...]] = ("bold green", "green", "yellow", "white")
+    
+    # Metrics row (status marker, status style, engine style, progress style) per engine state
+    _ROW_STATE_STYLES: ClassVar[Dict[str, Tuple[str, str, str, str]]] = {
+        "active": ("●", "bold bright_green", "bold bright_green", "bold bright_green"),
+        "completed": ("✓", "bold green", "bright_white", "green"),
+        "in_progress": ("○", "bright_yellow", "white", "bright_yellow"),
+        "pending": ("○", "bright_black", "dim white", "dim"),
+    }
+    
+    # Separator rules, built once instead of on every frame
+    _REQUEST_RULE: ClassVar[str] = "\n" + "─" * 110 + "\n\n"
+    _COLUMN_HEADER_RULE: ClassVar[str] = "─" * 40 + "\n"
+    _COLUMN_PROMPT_RULE: ClassVar[str] = "\n" + "─" * 40 + "\n\n"
+    
+    # Preferred break points when trimming the top of a scrolled response
+    _SCROLL_BREAKS: ClassVar[Tuple[str, ...]] = ('. ', '.\n', '! ', '?\n', ' ')
+    
+    # Engine column (border style, title marker) per streaming state
+    _COLUMN_STATE_STYLES: ClassVar[Dict[str, Tuple[str, str]]] = {
+        "streaming": ("green", "●"),
+        "generating": ("yellow", "○"),
+        "idle": ("bright_black", "○"),
+    }
+    # Column state indexed by (has response, has prompt) bits
+    _COLUMN_STATES: ClassVar[Tuple[str, ...]] = ("idle", "generating", "streaming", "streaming")
+    
     def __init__(self, config: Optional[DashboardConfig] = None, console: Optional[Console] = None):
         """
         Initialize live dashboard.
@@ -176,7 +329,39 @@ class LiveDashboard:
             console: Rich console instance
         """
         self.config = config or DashboardConfig()
-        self.console = console or Console()
+        self._console = console
+        self._idle_panels: "OrderedDict[Tuple[Any, ...], Panel]" = OrderedDict()
+        self._engine_headers: Dict[Tuple[Optional[str], Optional[str]], Text] = {}
+        self._pod_info_texts: Dict[int, Tuple[Any, Text]] = {}
+        self._column_titles: Dict[Tuple[str, str], str] = {}
+        self._last_column_panels: Dict[str, Tuple[Tuple[Any, ...], str, Panel]] = {}
+        self._active_column_panels: Dict[str, Panel] = {}
+        self._engines_layout: Optional[Layout] = None
+        self._engines_layout_names: Tuple[str, ...] = ()
+        self._engines_layout_panels: List[Optional[Panel]] = []
+        self._response_views: Dict[str, Tuple[str, Tuple[int, int, str]]] = {}
+        self._engine_summaries: Dict[
+            str, Tuple[EngineStats, Tuple[int, ...], Tuple[Optional[float], ...]]
+        ] = {}
+        self._display_layouts: Dict[str, Layout] = {}
+        self._empty_metrics_table: Optional[Table] = None
+        self._metric_cells: Dict[str, Tuple[List[Any], MetricCells]] = {}
+        self._request_panel: Optional[Panel] = None
+    
+    def start_run(self) -> None:
+        """Forget per-run cached statistics; call before a new run's first frame."""
+        self._engine_summaries.clear()
+    
+    @property
+    def console(self) -> Console:
+        """Rich console (the shared default console unless one was passed in)."""
+        if self._console is None:
+            self._console = _get_default_console()
+        return self._console
+    
+    @console.setter
+    def console(self, console: Console) -> None:
+        self._console = console
     
     def create_display(
         self,
@@ -214,29 +399,16 @@ class LiveDashboard:
         # Detect parallel mode
         is_parallel_mode = current_responses is not None and any(current_responses.values())
         
-        layout = Layout()
-        
-        # Configure layout structure based on mode
-        if is_parallel_mode:
-            # Parallel mode: multi-column streaming view
-            layout.split_column(
-                Layout(name="header", size=5),  # Progress bar
-                Layout(name="engines", size=30),  # Multi-column engine panels
-                Layout(name="metrics", minimum_size=12)  # Compact metrics
-            )
-        elif self.config.show_current_request:
-            # Sequential mode: single large response area
-            layout.split_column(
-                Layout(name="header", size=5),  # Progress bar
-                Layout(name="current", size=35),  # Large response area
-                Layout(name="metrics", minimum_size=12)  # Compact metrics
-            )
-        else:
-            # Minimal mode: just metrics
-            layout.split_column(
-                Layout(name="header", size=3),
-                Layout(name="metrics")
-            )
+        # The layout skeleton for each mode is built once and reused; every
+        # frame only updates the contents of its sections
+        mode = (
+            "parallel" if is_parallel_mode
+            else "sequential" if self.config.show_current_request
+            else "minimal"
+        )
+        layout = self._display_layouts.get(mode)
+        if layout is None:
+            layout = self._display_layouts[mode] = self._create_display_layout(mode)
         
         # Build header
         layout["header"].update(
@@ -266,6 +438,35 @@ class LiveDashboard:
         
         return layout
     
+    @staticmethod
+    def _create_display_layout(mode: str) -> Layout:
+        """Create the empty dashboard layout skeleton for a display mode."""
+        layout = Layout()
+        
+        # Configure layout structure based on mode
+        if mode == "parallel":
+            # Parallel mode: multi-column streaming view
+            layout.split_column(
+                Layout(name="header", size=5),  # Progress bar
+                Layout(name="engines", size=30),  # Multi-column engine panels
+                Layout(name="metrics", minimum_size=12)  # Compact metrics
+            )
+        elif mode == "sequential":
+            # Sequential mode: single large response area
+            layout.split_column(
+                Layout(name="header", size=5),  # Progress bar
+                Layout(name="current", size=35),  # Large response area
+                Layout(name="metrics", minimum_size=12)  # Compact metrics
+            )
+        else:
+            # Minimal mode: just metrics
+            layout.split_column(
+                Layout(name="header", size=3),
+                Layout(name="metrics")
+            )
+        
+        return layout
+    
     def _create_header(
         self,
         start_time: float,
@@ -281,20 +482,19 @@ class LiveDashboard:
         filled = int(bar_width * progress_pct / 100)
         bar = "█" * filled + "░" * (bar_width - filled)
         
-        header = Text()
-        # Title row
-        header.append(f"{self.config.title_emoji}  ", style="bold magenta")
-        header.append(f"{self.config.title}", style="bold white")
-        header.append(f"                    ", style="")
-        header.append(f"{completed_requests}/{total_requests} requests", style="bright_cyan")
-        header.append(f"  ·  ", style="bright_black")
-        header.append(f"{progress_pct:.1f}%", style="bold yellow")
-        header.append(f"  ·  ", style="bright_black")
-        header.append(f"{self._format_time(elapsed)}", style="cyan")
-        header.append("\n\n", style="")
-        
-        # Visual progress bar
-        header.append(bar, style="cyan")
+        # Title row, then the visual progress bar, assembled in one call
+        header = Text.assemble(
+            (f"{self.config.title_emoji}  ", "bold magenta"),
+            (self.config.title, "bold white"),
+            "                    ",
+            (f"{completed_requests}/{total_requests} requests", "bright_cyan"),
+            ("  ·  ", "bright_black"),
+            (f"{progress_pct:.1f}%", "bold yellow"),
+            ("  ·  ", "bright_black"),
+            (self._format_time(elapsed), "cyan"),
+            "\n\n",
+            (bar, "cyan"),
+        )
         
         return Panel(
             header,
@@ -316,6 +516,52 @@ class LiveDashboard:
             mins = int((seconds % 3600) // 60)
             return f"{hours}h {mins}m"
     
+    def _get_response_view(self, slot: str, response: str, max_chars: int) -> Tuple[int, int, str]:
+        """
+        Get the word count and auto-scrolled tail of a streaming response.
+        
+        Streaming responses only grow, so the word count is extended from the
+        previous frame of the same slot instead of re-splitting the whole text.
+        
+        Args:
+            slot: Cache slot (one per panel showing a response)
+            response: Response text received so far
+            max_chars: Maximum number of trailing characters to show
+            
+        Returns:
+            Tuple of (word count, characters hidden above, visible text)
+        """
+        last = self._response_views.get(slot)
+        if last is not None and last[0] == response:
+            return last[1]
+        
+        if last is not None and last[0] and response.startswith(last[0]):
+            previous = last[0]
+            added = response[len(previous):]
+            word_count = last[1][0] + len(added.split())
+            if added and not previous[-1].isspace() and not added[0].isspace():
+                # The new text continues the last word of the previous frame
+                word_count -= 1
+        else:
+            word_count = len(response.split())
+        
+        chars_hidden = max(len(response) - max_chars, 0)
+        response_tail = response
+        if chars_hidden:
+            # Show the last N characters (scrolled to bottom)
+            response_tail = response[-max_chars:]
+            
+            # Find a good breaking point (start of a word/sentence if possible)
+            for break_char in self._SCROLL_BREAKS:
+                break_idx = response_tail.find(break_char)
+                if break_idx > 0 and break_idx < 100:  # Within first 100 chars
+                    response_tail = response_tail[break_idx + len(break_char):]
+                    break
+        
+        view = (word_count, chars_hidden, response_tail)
+        self._response_views[slot] = (response, view)
+        return view
+    
     def _create_current_request_panel(
         self,
         current_engine: Optional[str],
@@ -324,17 +570,7 @@ class LiveDashboard:
     ) -> Panel:
         """Create elegant current request/response panel - Jony Ive inspired."""
         if not current_engine or not current_prompt:
-            empty_text = Text()
-            empty_text.append("\n", style="")
-            empty_text.append("        Initializing", style="dim italic")
-            empty_text.append("\n\n", style="")
-            return Panel(
-                empty_text,
-                title="[dim]Streaming Response[/dim]",
-                border_style="bright_black",
-                box=box.SIMPLE,
-                padding=(1, 2)
-            )
+            return _initializing_request_panel()
         
         current_text = Text()
         
@@ -350,42 +586,28 @@ class LiveDashboard:
             else current_prompt
         )
         current_text.append(prompt_preview, style="bright_yellow")
-        current_text.append("\n", style="")
-        current_text.append("─" * 110, style="bright_black")
-        current_text.append("\n\n", style="")
+        current_text.append(self._REQUEST_RULE, style="bright_black")
         
         if current_response:
+            word_count, chars_hidden, response_tail = self._get_response_view(
+                "current", current_response, self.config.response_preview_length
+            )
+            
             # Metadata line with better visibility
             if self.config.show_word_count:
-                word_count = len(current_response.split())
                 current_text.append(f"{word_count:,} words", style="bright_cyan")
-                current_text.append(f"  ·  ", style="bright_black")
-                current_text.append(f"{len(current_response):,} characters", style="bright_magenta")
-                current_text.append("\n\n", style="")
+                current_text.append("  ·  ", style="bright_black")
+                current_text.append(f"{len(current_response):,} characters\n\n", style="bright_magenta")
             
             # Auto-scroll: show the last N characters that fit in the panel
             # If response is longer than preview limit, show the tail with scroll indicator
-            if len(current_response) > self.config.response_preview_length:
-                # Calculate how much we're scrolling past
-                chars_hidden = len(current_response) - self.config.response_preview_length
-                
+            if chars_hidden:
                 # Show scroll indicator with better visibility
                 current_text.append(
                     f"▲  {chars_hidden:,} characters hidden above  ▲\n\n",
                     style="bold bright_black"
                 )
                 
-                # Show the last N characters (scrolled to bottom)
-                response_tail = current_response[-self.config.response_preview_length:]
-                
-                # Find a good breaking point (start of a word/sentence if possible)
-                # Look for sentence breaks first, then word breaks
-                for break_char in ['. ', '.\n', '! ', '?\n', ' ']:
-                    break_idx = response_tail.find(break_char)
-                    if break_idx > 0 and break_idx < 100:  # Within first 100 chars
-                        response_tail = response_tail[break_idx + len(break_char):]
-                        break
-                
                 current_text.append(response_tail, style="bright_green")
                 current_text.append(" ▋", style="bold bright_green blink")  # Active typing indicator
             else:
@@ -396,7 +618,7 @@ class LiveDashboard:
                 if len(current_response) < 200:
                     current_text.append(" ▋", style="bold bright_green blink")
         else:
-            current_text.append(f"⏳ Sending request to model...", style="dim italic")
+            current_text.append("⏳ Sending request to model...", style="dim italic")
         
         # Panel with clear visual hierarchy
         if current_response:
@@ -406,13 +628,21 @@ class LiveDashboard:
             title_text = "[dim]○ Initializing[/dim]"
             border_color = "bright_black"
         
-        return Panel(
-            current_text,
-            title=title_text,
-            border_style=border_color,
-            box=box.HEAVY,
-            padding=(1, 1)
-        )
+        # One request panel is kept and only its content and styling swapped
+        panel = self._request_panel
+        if panel is None:
+            panel = self._request_panel = Panel(
+                current_text,
+                title=title_text,
+                border_style=border_color,
+                box=box.HEAVY,
+                padding=(1, 1)
+            )
+        else:
+            panel.renderable = current_text
+            panel.title = title_text
+            panel.border_style = border_color
+        return panel
     
     def _create_parallel_engines_panel(
         self,
@@ -426,23 +656,19 @@ class LiveDashboard:
         
         Similar to the race demo, shows all engines side-by-side with live streaming.
         """
-        from rich.layout import Layout
-        from rich.text import Text
-        
-        # Create layout for engines
-        engines_layout = Layout()
-        
-        # Create columns for each engine
-        engine_names = [target["engine"] for target in targets]
-        columns = []
-        for i, engine_name in enumerate(engine_names):
-            columns.append(Layout(name=f"engine_{i}"))
-        
-        # Split into columns (up to 3 engines side-by-side)
-        if len(columns) > 0:
-            engines_layout.split_row(*columns)
+        # The column layout is built once per set of engines; later frames
+        # only re-point the columns whose panel object changed
+        engine_names = tuple(target["engine"] for target in targets)
+        if self._engines_layout is None or self._engines_layout_names != engine_names:
+            self._engines_layout = Layout()
+            self._engines_layout_names = engine_names
+            self._engines_layout_panels = [None] * len(targets)
+            if targets:
+                self._engines_layout.split_row(
+                    *(Layout(name=f"engine_{i}") for i in range(len(targets)))
+                )
+        engines_layout = self._engines_layout
         
-        # Fill each column with engine panel
         for i, target in enumerate(targets):
             engine_name = target["engine"]
             response = current_responses.get(engine_name, "")
@@ -456,10 +682,103 @@ class LiveDashboard:
                 engine_type=target.get("type"),
                 pod_info=target.get("pod_info")
             )
-            engines_layout[f"engine_{i}"].update(panel)
+            if panel is not self._engines_layout_panels[i]:
+                engines_layout[f"engine_{i}"].update(panel)
+                self._engines_layout_panels[i] = panel
         
         return engines_layout
     
+    def _get_engine_header(self, engine_url: Optional[str], engine_type: Optional[str]) -> Text:
+        """
+        Get the URL/type header for an engine column, built once per engine.
+        
+        The returned Text is shared; callers must not modify it.
+        """
+        key = (engine_url, engine_type)
+        header = self._engine_headers.get(key)
+        if header is None:
+            header = Text()
+            if engine_url:
+                header.append("🌐 ", style="dim")
+                header.append(engine_url, style="bright_black italic")
+                header.append("\n", style="")
+            if engine_type:
+                header.append("⚙️  ", style="dim")
+                header.append(engine_type, style="bright_black")
+                header.append("\n", style="")
+            self._engine_headers[key] = header
+        return header
+    
+    def _get_pod_info_text(self, pod_info: Any) -> Text:
+        """
+        Get the pod/resources block for an engine column, built once per pod.
+        
+        Pod info objects are not mutated during a run, so the formatted Text
+        is cached by identity.
+        """
+        cached = self._pod_info_texts.get(id(pod_info))
+        if cached is not None and cached[0] is pod_info:
+            return cached[1]
+        
+        info = Text()
+        if pod_info.pod_name:
+            info.append("🐳 ", style="dim")
+            info.append(pod_info.pod_name, style="bright_black")
+            if pod_info.namespace:
+                info.append(f" ({pod_info.namespace})", style="dim")
+            info.append("\n", style="")
+        
+        if pod_info.resources:
+            res = pod_info.resources
+            
+            # CPU
+            if res.cpu_request or res.cpu_limit:
+                info.append("💻 ", style="dim")
+                if res.cpu_request:
+                    info.append(f"{res.cpu_request}", style="cyan")
+                if res.cpu_limit:
+                    info.append(f" → {res.cpu_limit}", style="bright_cyan")
+                info.append("\n", style="")
+            
+            # Memory
+            if res.memory_request or res.memory_limit:
+                info.append("🧠 ", style="dim")
+                if res.memory_request:
+                    info.append(f"{res.memory_request}", style="yellow")
+                if res.memory_limit:
+                    info.append(f" → {res.memory_limit}", style="bright_yellow")
+                info.append("\n", style="")
+            
+            # GPU
+            if res.gpu_count:
+                info.append("🎮 ", style="dim")
+                info.append(f"{res.gpu_count}x GPU", style="green")
+                if res.gpu_type:
+                    gpu_display = res.gpu_type.split('/')[-1]
+                    info.append(f" ({gpu_display})", style="dim")
+                info.append("\n", style="")
+    
+        self._pod_info_texts[id(pod_info)] = (pod_info, info)
+        return info
+    
+    @staticmethod
+    def _pod_info_key(pod_info: Optional[Any]) -> Optional[Tuple[Any, ...]]:
+        """
+        Get a hashable key of the pod fields shown in an engine column.
+        
+        Keying on these values rather than the object's id() keeps a cached
+        panel from being served for a different pod that reuses the address.
+        """
+        if not pod_info:
+            return None
+        res = pod_info.resources
+        resources = (
+            res.cpu_request, res.cpu_limit,
+            res.memory_request, res.memory_limit,
+            res.gpu_count, res.gpu_type
+        ) if res else None
+        return (pod_info.pod_name, pod_info.namespace, resources)
+    
     def _create_engine_column_panel(
         self,
         engine_name: str,
@@ -471,62 +790,34 @@ class LiveDashboard:
         pod_info: Optional[Any] = None
     ) -> Panel:
         """Create a compact panel for one engine in parallel mode with auto-scroll."""
-        from rich.text import Text
+        render_key = (
+            prompt, engine_url, engine_type, self._pod_info_key(pod_info),
+            (stats.completed, stats.target, stats.failed) if stats else None
+        )
         
-        content = Text()
+        # A column whose inputs are unchanged since its last frame keeps its panel
+        last = self._last_column_panels.get(engine_name)
+        if last is not None and last[0] == render_key and last[1] == response:
+            return last[2]
         
-        # Engine info header
-        if engine_url:
-            content.append("🌐 ", style="dim")
-            content.append(engine_url, style="bright_black italic")
-            content.append("\n", style="")
-        if engine_type:
-            content.append("⚙️  ", style="dim")
-            content.append(engine_type, style="bright_black")
-            content.append("\n", style="")
+        # Idle panels (no response yet) are identical frame to frame, so
+        # equal requests share one Panel instance
+        idle_key = None
+        if not response:
+            idle_key = (engine_name,) + render_key
+            cached = self._idle_panels.get(idle_key)
+            if cached is not None:
+                self._idle_panels.move_to_end(idle_key)
+                return cached
         
-        # Pod and resource information
+        # Engine info header, then pod and resource information, assembled
+        # from the cached fragments into a fresh Text
+        fragments: List[Any] = [self._get_engine_header(engine_url, engine_type)]
         if pod_info:
-            if pod_info.pod_name:
-                content.append("🐳 ", style="dim")
-                content.append(pod_info.pod_name, style="bright_black")
-                if pod_info.namespace:
-                    content.append(f" ({pod_info.namespace})", style="dim")
-                content.append("\n", style="")
-            
-            if pod_info.resources:
-                res = pod_info.resources
-                
-                # CPU
-                if res.cpu_request or res.cpu_limit:
-                    content.append("💻 ", style="dim")
-                    if res.cpu_request:
-                        content.append(f"{res.cpu_request}", style="cyan")
-                    if res.cpu_limit:
-                        content.append(f" → {res.cpu_limit}", style="bright_cyan")
-                    content.append("\n", style="")
-                
-                # Memory
-                if res.memory_request or res.memory_limit:
-                    content.append("🧠 ", style="dim")
-                    if res.memory_request:
-                        content.append(f"{res.memory_request}", style="yellow")
-                    if res.memory_limit:
-                        content.append(f" → {res.memory_limit}", style="bright_yellow")
-                    content.append("\n", style="")
-                
-                # GPU
-                if res.gpu_count:
-                    content.append("🎮 ", style="dim")
-                    content.append(f"{res.gpu_count}x GPU", style="green")
-                    if res.gpu_type:
-                        gpu_display = res.gpu_type.split('/')[-1]
-                        content.append(f" ({gpu_display})", style="dim")
-                    content.append("\n", style="")
-        
+            fragments.append(self._get_pod_info_text(pod_info))
         if engine_url or engine_type or pod_info:
-            content.append("─" * 40, style="bright_black")
-            content.append("\n", style="")
+            fragments.append((self._COLUMN_HEADER_RULE, "bright_black"))
+        content = Text.assemble(*fragments)
         
         # Status line with metrics
         if stats:
@@ -542,43 +833,29 @@ class LiveDashboard:
         if prompt:
             prompt_preview = prompt[:80] + "..." if len(prompt) > 80 else prompt
             content.append(prompt_preview, style="dim")
-            content.append("\n", style="")
-            content.append("─" * 40, style="bright_black")
-            content.append("\n\n", style="")
+            content.append(self._COLUMN_PROMPT_RULE, style="bright_black")
         
         # Show response with auto-scroll
         if response:
+            # Auto-scroll: show last N characters for multi-column view
+            max_chars = 800  # Show more text in parallel view (increased for better readability)
+            word_count, chars_hidden, response_tail = self._get_response_view(
+                engine_name, response, max_chars
+            )
+            
             # Add word and character count
-            word_count = len(response.split())
             char_count = len(response)
             content.append(f"{word_count:,} words", style="bright_cyan")
             content.append("  ·  ", style="bright_black")
-            content.append(f"{char_count:,} chars", style="bright_magenta")
-            content.append("\n\n", style="")
+            content.append(f"{char_count:,} chars\n\n", style="bright_magenta")
             
-            # Auto-scroll: show last N characters for multi-column view
-            max_chars = 800  # Show more text in parallel view (increased for better readability)
-            
-            if len(response) > max_chars:
-                # Calculate how much we're scrolling past
-                chars_hidden = len(response) - max_chars
-                
+            if chars_hidden:
                 # Show scroll indicator
                 content.append(
                     f"▲  {chars_hidden:,} characters hidden above  ▲\n\n",
                     style="bold bright_black"
                 )
                 
-                # Show the last N characters (scrolled to bottom)
-                response_tail = response[-max_chars:]
-                
-                # Find a good breaking point (start of a word/sentence if possible)
-                for break_char in ['. ', '.\n', '! ', '?\n', ' ']:
-                    break_idx = response_tail.find(break_char)
-                    if break_idx > 0 and break_idx < 100:
-                        response_tail = response_tail[break_idx + len(break_char):]
-                        break
-                
                 content.append(response_tail, style="bright_green")
             else:
                 # Response fits in panel, show all
@@ -595,31 +872,80 @@ class LiveDashboard:
             content.append("Waiting...", style="dim italic")
         
         # Panel styling based on state
-        if response:
-            border_style = "green"
-            title_emoji = "●"
-        elif prompt:
-            border_style = "yellow"
-            title_emoji = "○"
+        state = self._COLUMN_STATES[bool(response) << 1 | bool(prompt)]
+        border_style, title_emoji = self._COLUMN_STATE_STYLES[state]
+        title_key = (engine_name, state)
+        title = self._column_titles.get(title_key)
+        if title is None:
+            title = self._column_titles[title_key] = f"[bold]{title_emoji} {engine_name}[/bold]"
+        
+        # Idle panels are shared through the LRU; active columns keep one
+        # Panel per engine and only swap its contents
+        panel = None if idle_key is not None else self._active_column_panels.get(engine_name)
+        if panel is None:
+            panel = Panel(
+                content,
+                title=title,
+                border_style=border_style,
+                box=box.ROUNDED,
+                padding=(1, 1)
+            )
+            if idle_key is None:
+                self._active_column_panels[engine_name] = panel
         else:
-            border_style = "bright_black"
-            title_emoji = "○"
+            panel.renderable = content
+            panel.title = title
+            panel.border_style = border_style
         
-        return Panel(
-            content,
-            title=f"[bold]{title_emoji} {engine_name}[/bold]",
-            border_style=border_style,
-            box=box.ROUNDED,
-            padding=(1, 1)
+        if idle_key is not None:
+            self._idle_panels[idle_key] = panel
+            if len(self._idle_panels) > self._IDLE_PANEL_CACHE_SIZE:
+                self._idle_panels.popitem(last=False)
+        
+        self._last_column_panels[engine_name] = (render_key, response, panel)
+        return panel
+    
+    def _get_engine_summary(self, engine_name: str, stats: EngineStats) -> Tuple[Optional[float], ...]:
+        """
+        Get the derived statistics shown in an engine's metrics row.
+        
+        Samples are only ever appended, so the summary is recomputed only
+        when one of the sample lists has grown since the last frame. The
+        cached entry keeps its stats object and is only reused for that same
+        object.
+        
+        Returns:
+            Tuple of (tps std dev, avg TTFT, p95 TTFT, avg duration, p95 duration,
+            avg inter-token latency, avg tokens/response, token/word ratio)
+        """
+        key = (
+            len(stats.token_rates),
+            len(stats.ttft_values),
+            len(stats.response_durations),
+            len(stats.inter_token_latencies),
+            len(stats.tokens_per_response),
+            len(stats.words_per_response),
+        )
+        cached = self._engine_summaries.get(engine_name)
+        if cached is not None and cached[0] is stats and cached[1] == key:
+            return cached[2]
+        
+        summary = (
+            stats.get_token_rate_variance(),
+            stats.get_avg_ttft(),
+            stats.get_ttft_p95(),
+            stats.get_avg_response_duration(),
+            stats.get_response_duration_p95(),
+            stats.get_avg_inter_token_latency(),
+            stats.get_avg_tokens_per_response(),
+            stats.get_token_word_ratio(),
         )
+        self._engine_summaries[engine_name] = (stats, key, summary)
+        return summary
     
-    def _create_metrics_table(
-        self,
-        targets: List[Dict[str, str]],
-        engine_metrics: Dict[str, Any],
-        current_engine: Optional[str]
-    ) -> Table:
-        """Create elegant metrics table - Jony Ive inspired clean design."""
+    @staticmethod
+    def _create_metrics_table_skeleton() -> Table:
+        """Create the metrics table with its columns and no rows."""
         table = Table(
             title="[bold white]Performance Metrics[/bold white]",
             box=box.HEAVY,
@@ -644,22 +970,148 @@ class LiveDashboard:
         table.add_column("Total", justify="right", width=9)
         table.add_column("", justify="center", width=4)  # Status
         
-        # Find current leader
+        return table
+    
+    def _format_metric_cells(
+        self,
+        completed: int,
+        failed: int,
+        avg_tps: float,
+        total_tokens: int,
+        target_count: int,
+        tps_variance: Optional[float],
+        avg_ttft: Optional[float],
+        ttft_p95: Optional[float],
+        avg_response_duration: Optional[float],
+        response_duration_p95: Optional[float],
+        avg_inter_token: Optional[float],
+        avg_tokens_per_resp: Optional[float],
+        token_word_ratio: Optional[float]
+    ) -> MetricCells:
+        """Format the metric cells of one engine row (everything but engine and status)."""
+        # Progress
+        progress_text = f"{completed}/{target_count}"
+        
+        # Throughput - clear avg ± variance
+        if avg_tps > 0:
+            if tps_variance is not None:
+                tps_text = f"{avg_tps:.1f} ± {tps_variance:.1f}"
+            else:
+                tps_text = f"{avg_tps:.1f}"
+            
+            # Strong color for good performance
+            tps_style = self._TPS_STYLES[bisect.bisect_right(self.TPS_THRESHOLDS, avg_tps)]
+            tps_display = f"[{tps_style}]{tps_text}[/{tps_style}] [dim]tok/s[/dim]"
+        else:
+            tps_display = "[bright_black]—[/bright_black]"
+        
+        # TTFT - clear avg · p95 format in milliseconds
+        if avg_ttft is not None:
+            ttft_ms_avg = avg_ttft * 1000
+            if ttft_p95 is not None:
+                ttft_ms_p95 = ttft_p95 * 1000
+                ttft_text = f"{ttft_ms_avg:.0f} · {ttft_ms_p95:.0f}"
+            else:
+                ttft_text = f"{ttft_ms_avg:.0f}"
+            
+            # Good latency = green/yellow, slower = white
+            ttft_style = self._TTFT_STYLES[
+                bisect.bisect_right(self.TTFT_THRESHOLDS, avg_ttft)
+            ]
+            ttft_display = f"[{ttft_style}]{ttft_text}[/{ttft_style}] [dim]ms[/dim]"
+        else:
+            ttft_display = "[bright_black]—[/bright_black]"
+        
+        # Total generation time - clear avg · p95 format
+        if avg_response_duration is not None:
+            if response_duration_p95 is not None:
+                gen_time_text = f"{avg_response_duration:.1f} · {response_duration_p95:.1f}"
+            else:
+                gen_time_text = f"{avg_response_duration:.1f}"
+            
+            # Fast = magenta/purple tones
+            gen_time_style = self._DURATION_STYLES[
+                bisect.bisect_right(self.DURATION_THRESHOLDS, avg_response_duration)
+            ]
+            gen_time_display = f"[{gen_time_style}]{gen_time_text}[/{gen_time_style}] [dim]s[/dim]"
+        else:
+            gen_time_display = "[bright_black]—[/bright_black]"
+        
+        # Inter-token latency - smooth = green
+        if avg_inter_token is not None:
+            inter_token_text = f"{avg_inter_token:.1f}"
+            
+            # Low latency = green (smooth streaming)
+            inter_token_style = self._INTER_TOKEN_STYLES[
+                bisect.bisect_right(self.INTER_TOKEN_THRESHOLDS, avg_inter_token)
+            ]
+            inter_token_display = f"[{inter_token_style}]{inter_token_text}[/{inter_token_style}] [dim]ms[/dim]"
+        else:
+            inter_token_display = "[bright_black]—[/bright_black]"
+        
+        # Tokens per response - shows response size consistency
+        if avg_tokens_per_resp is not None and avg_tokens_per_resp > 0:
+            tokens_per_resp_text = f"{avg_tokens_per_resp:.0f}"
+            tokens_per_resp_display = f"[bright_blue]{tokens_per_resp_text}[/bright_blue]"
+        else:
+            tokens_per_resp_display = "[bright_black]—[/bright_black]"
+        
+        # Token/word ratio - shows tokenizer efficiency
+        if token_word_ratio is not None:
+            ratio_text = f"{token_word_ratio:.2f}"
+            # Color code by efficiency: lower is better
+            ratio_style = self._RATIO_STYLES[
+                bisect.bisect_right(self.RATIO_THRESHOLDS, token_word_ratio)
+            ]
+            ratio_display = f"[{ratio_style}]{ratio_text}[/{ratio_style}]"
+        else:
+            ratio_display = "[bright_black]—[/bright_black]"
+        
+        # Total tokens - subtle
+        tokens_text = f"{total_tokens:,}" if total_tokens > 0 else "—"
+        
+        return MetricCells(
+            progress=progress_text,
+            throughput=tps_display,
+            ttft=ttft_display,
+            duration=gen_time_display,
+            inter_token=inter_token_display,
+            tokens_per_response=tokens_per_resp_display,
+            token_word_ratio=ratio_display,
+            total_tokens=tokens_text,
+        )
+    
+    def _create_metrics_table(
+        self,
+        targets: List[Dict[str, str]],
+        engine_metrics: Dict[str, Any],
+        current_engine: Optional[str]
+    ) -> Table:
+        """Create elegant metrics table - Jony Ive inspired clean design."""
+        # Nothing to show yet: every frame can share one empty table
+        if not targets:
+            if self._empty_metrics_table is None:
+                self._empty_metrics_table = self._create_metrics_table_skeleton()
+            return self._empty_metrics_table
+        
+        table = self._create_metrics_table_skeleton()
+        
+        # Single pass: extract each engine's values and track the leader
+        rows = []
         leader_tps = 0
         leader_engine = None
         
-        for engine_name, stats in engine_metrics.items():
-            avg_tps = stats.get("avg_tps", 0) if isinstance(stats, dict) else getattr(stats, "avg_tps", 0)
-            if avg_tps > leader_tps:
-                leader_tps = avg_tps
-                leader_engine = engine_name
+        # Metrics are either all EngineStats or all plain dicts; check the
+        # kind once per table instead of once per row
+        first_stats = next(iter(engine_metrics.values()), None)
+        plain_dicts = first_stats is None or isinstance(first_stats, dict)
         
-        # Add rows for each engine
         for target in targets:
             engine_name = target["engine"]
-            stats = engine_metrics.get(engine_name, {})
+            stats = engine_metrics.get(engine_name)
             
-            if isinstance(stats, dict):
+            if plain_dicts or stats is None:
+                stats = stats or {}
                 completed = stats.get("completed", 0)
                 failed = stats.get("failed", 0)
                 avg_tps = stats.get("avg_tps", 0)
@@ -674,169 +1126,72 @@ class LiveDashboard:
                 avg_tokens_per_resp = None
                 token_word_ratio = None
             else:
-                completed = getattr(stats, "completed", 0)
-                failed = getattr(stats, "failed", 0)
-                avg_tps = getattr(stats, "avg_tps", 0)
-                total_tokens = getattr(stats, "total_tokens", 0)
-                target_count = getattr(stats, "target", 0)
-                tps_variance = stats.get_token_rate_variance()
-                avg_ttft = stats.get_avg_ttft()
-                ttft_p95 = stats.get_ttft_p95()
-                avg_response_duration = stats.get_avg_response_duration()
-                response_duration_p95 = stats.get_response_duration_p95()
-                avg_inter_token = stats.get_avg_inter_token_latency()
-                avg_tokens_per_resp = stats.get_avg_tokens_per_response()
-                token_word_ratio = stats.get_token_word_ratio()
+                try:
+                    completed, failed, avg_tps, total_tokens, target_count = _ROW_COUNTERS(stats)
+                except AttributeError:
+                    completed = getattr(stats, "completed", 0)
+                    failed = getattr(stats, "failed", 0)
+                    avg_tps = getattr(stats, "avg_tps", 0)
+                    total_tokens = getattr(stats, "total_tokens", 0)
+                    target_count = getattr(stats, "target", 0)
+                (tps_variance, avg_ttft, ttft_p95, avg_response_duration,
+                 response_duration_p95, avg_inter_token, avg_tokens_per_resp,
+                 token_word_ratio) = self._get_engine_summary(engine_name, stats)
             
-            total = completed + failed
-            
-            # Progress
-            progress_text = f"{completed}/{target_count}"
-            
-            # Throughput - clear avg ± variance
-            if avg_tps > 0:
-                if tps_variance is not None:
-                    tps_text = f"{avg_tps:.1f} ± {tps_variance:.1f}"
-                else:
-                    tps_text = f"{avg_tps:.1f}"
-                
-                # Strong color for good performance
-                if avg_tps >= 50:
-                    tps_display = f"[bold green]{tps_text}[/bold green] [dim]tok/s[/dim]"
-                elif avg_tps >= 30:
-                    tps_display = f"[green]{tps_text}[/green] [dim]tok/s[/dim]"
-                elif avg_tps >= 15:
-                    tps_display = f"[yellow]{tps_text}[/yellow] [dim]tok/s[/dim]"
-                else:
-                    tps_display = f"[white]{tps_text}[/white] [dim]tok/s[/dim]"
-            else:
-                tps_display = "[bright_black]—[/bright_black]"
-            
-            # TTFT - clear avg · p95 format in milliseconds
-            if avg_ttft is not None:
-                ttft_ms_avg = avg_ttft * 1000
-                if ttft_p95 is not None:
-                    ttft_ms_p95 = ttft_p95 * 1000
-                    ttft_text = f"{ttft_ms_avg:.0f} · {ttft_ms_p95:.0f}"
-                else:
-                    ttft_text = f"{ttft_ms_avg:.0f}"
-                
-                # Good latency = green/yellow, slower = white
-                if avg_ttft < 0.1:
-                    ttft_display = f"[bold green]{ttft_text}[/bold green] [dim]ms[/dim]"
-                elif avg_ttft < 0.2:
-                    ttft_display = f"[green]{ttft_text}[/green] [dim]ms[/dim]"
-                elif avg_ttft < 0.4:
-                    ttft_display = f"[yellow]{ttft_text}[/yellow] [dim]ms[/dim]"
-                else:
-                    ttft_display = f"[white]{ttft_text}[/white] [dim]ms[/dim]"
-            else:
-                ttft_display = "[bright_black]—[/bright_black]"
-            
-            # Total generation time - clear avg · p95 format
-            if avg_response_duration is not None:
-                if response_duration_p95 is not None:
-                    gen_time_text = f"{avg_response_duration:.1f} · {response_duration_p95:.1f}"
-                else:
-                    gen_time_text = f"{avg_response_duration:.1f}"
-                
-                # Fast = magenta/purple tones
-                if avg_response_duration < 5:
-                    gen_time_display = f"[bold magenta]{gen_time_text}[/bold magenta] [dim]s[/dim]"
-                elif avg_response_duration < 15:
-                    gen_time_display = f"[magenta]{gen_time_text}[/magenta] [dim]s[/dim]"
-                else:
-                    gen_time_display = f"[white]{gen_time_text}[/white] [dim]s[/dim]"
-            else:
-                gen_time_display = "[bright_black]—[/bright_black]"
-            
-            # Inter-token latency - smooth = green
-            if avg_inter_token is not None:
-                inter_token_text = f"{avg_inter_token:.1f}"
-                
-                # Low latency = green (smooth streaming)
-                if avg_inter_token < 20:
-                    inter_token_display = f"[bold green]{inter_token_text}[/bold green] [dim]ms[/dim]"
-                elif avg_inter_token < 40:
-                    inter_token_display = f"[green]{inter_token_text}[/green] [dim]ms[/dim]"
-                elif avg_inter_token < 80:
-                    inter_token_display = f"[yellow]{inter_token_text}[/yellow] [dim]ms[/dim]"
-                else:
-                    inter_token_display = f"[white]{inter_token_text}[/white] [dim]ms[/dim]"
-            else:
-                inter_token_display = "[bright_black]—[/bright_black]"
+            if avg_tps > leader_tps:
+                leader_tps = avg_tps
+                leader_engine = engine_name
             
-            # Tokens per response - shows response size consistency
-            if avg_tokens_per_resp is not None and avg_tokens_per_resp > 0:
-                tokens_per_resp_text = f"{avg_tokens_per_resp:.0f}"
-                tokens_per_resp_display = f"[bright_blue]{tokens_per_resp_text}[/bright_blue]"
-            else:
-                tokens_per_resp_display = "[bright_black]—[/bright_black]"
+            rows.append((
+                engine_name, completed, failed, avg_tps, total_tokens, target_count,
+                tps_variance, avg_ttft, ttft_p95, avg_response_duration,
+                response_duration_p95, avg_inter_token, avg_tokens_per_resp,
+                token_word_ratio,
+            ))
+        
+        # Add rows for each engine
+        for engine_name, *values in rows:
+            completed, failed, avg_tps, _, target_count = values[:5]
+            total = completed + failed
             
-            # Token/word ratio - shows tokenizer efficiency
-            if token_word_ratio is not None:
-                ratio_text = f"{token_word_ratio:.2f}"
-                # Color code by efficiency: lower is better
-                if token_word_ratio < 1.3:
-                    ratio_display = f"[bold green]{ratio_text}[/bold green]"  # Efficient
-                elif token_word_ratio < 1.5:
-                    ratio_display = f"[green]{ratio_text}[/green]"  # Good
-                elif token_word_ratio < 1.7:
-                    ratio_display = f"[yellow]{ratio_text}[/yellow]"  # Average
-                else:
-                    ratio_display = f"[white]{ratio_text}[/white]"  # Less efficient
+            # Formatted cells only change when one of the row's values does
+            cached = self._metric_cells.get(engine_name)
+            if cached is not None and cached[0] == values:
+                cells = cached[1]
             else:
-                ratio_display = "[bright_black]—[/bright_black]"
-            
-            # Total tokens - subtle
-            tokens_text = f"{total_tokens:,}" if total_tokens > 0 else "—"
+                cells = self._format_metric_cells(*values)
+                self._metric_cells[engine_name] = (values, cells)
             
             # Active engine gets special treatment
             engine_match = current_engine and engine_name in current_engine
             
+            engine_display = engine_name
             if engine_match:
                 # ACTIVE - bright and obvious
-                status = "●"
-                status_style = "bold bright_green"
+                state = "active"
                 engine_display = f"▶ {engine_name}"
-                engine_style = "bold bright_green"
-                progress_style = "bold bright_green"
             elif completed >= target_count and target_count > 0:
-                # COMPLETED
-                status = "✓"
-                status_style = "bold green"
-                engine_display = engine_name
+                state = "completed"
                 # Add leader star if applicable
                 if engine_name == leader_engine and avg_tps > 0:
                     engine_display = f"★ {engine_name}"
-                engine_style = "bright_white"
-                progress_style = "green"
             elif total > 0:
-                # IN PROGRESS
-                status = "○"
-                status_style = "bright_yellow"
-                engine_display = engine_name
-                engine_style = "white"
-                progress_style = "bright_yellow"
+                state = "in_progress"
             else:
-                # PENDING
-                status = "○"
-                status_style = "bright_black"
-                engine_display = engine_name
-                engine_style = "dim white"
-                progress_style = "dim"
+                state = "pending"
+            status, status_style, engine_style, progress_style = self._ROW_STATE_STYLES[state]
             
             # Add row with dynamic styling based on state
             table.add_row(
                 f"[{engine_style}]{engine_display}[/{engine_style}]",
-                f"[{progress_style}]{progress_text}[/{progress_style}]",
-                tps_display,
-                ttft_display,
-                gen_time_display,
-                inter_token_display,
-                tokens_per_resp_display,
-                ratio_display,
-                tokens_text,
+                f"[{progress_style}]{cells.progress}[/{progress_style}]",
+                cells.throughput,
+                cells.ttft,
+                cells.duration,
+                cells.inter_token,
+                cells.tokens_per_response,
+                cells.token_word_ratio,
+                cells.total_tokens,
                 f"[{status_style}]{status}[/{status_style}]"
             )
         
@@ -5,19 +5,21 @@ Provides reusable interactive selection for engines and models
 to be benchmarked.
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, TYPE_CHECKING
 from dataclasses import dataclass
 
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich import box
 
 from ..core.connection_manager import ConnectionManager
 from ..utils.k8s_metadata import PodInfo
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
 
 @dataclass
 class BenchmarkTarget:
@@ -54,6 +56,28 @@ class TargetSelector:
             console: Rich console instance
         """
         self.console = console or Console()
+        self._progress: Optional["Progress"] = None
+    
+    def _get_progress(self) -> "Progress":
+        """
+        Get the spinner progress display, reset for a new step.
+        
+        One Progress is built per selector and reused for every discovery
+        step instead of constructing new columns each time.
+        """
+        if self._progress is None:
+            # rich.progress is only needed once discovery runs
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            
+            self._progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=self.console
+            )
+        else:
+            for task_id in list(self._progress.task_ids):
+                self._progress.remove_task(task_id)
+        return self._progress
     
     async def select_targets(
         self,
@@ -138,11 +162,7 @@ class TargetSelector:
         self.console.print(f"[bold]Model for {engine_name}:[/bold]")
         
         # Discover models
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console
-        ) as progress:
+        with self._get_progress() as progress:
             task = progress.add_task("Discovering models...", total=None)
             models = await connection_manager.discover_models(engine_name)
             progress.update(task, completed=True)
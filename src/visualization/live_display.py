@@ -5,29 +5,36 @@ This module provides real-time visualization of streaming LLM responses
 with live metrics, performance indicators, and side-by-side comparisons.
 """
 
+import asyncio
+import io
+import sys
+import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, ClassVar, Literal, Sequence, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
+from itertools import chain, islice
 
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.table import Table
-from rich.layout import Layout
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
-from rich import box
 from pydantic import BaseModel, Field
 
+# rich is imported where panels are built, so headless runs never load it
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.layout import Layout
 
-class PerformanceLevel(Enum):
-    """Performance level classification."""
-    EXCELLENT = "excellent"  # Green
-    GOOD = "good"           # Cyan
-    MODERATE = "moderate"   # Yellow
-    SLOW = "slow"           # Red
+
+class PerformanceLevel(IntEnum):
+    """Performance level classification, usable as an index into color tables."""
+    EXCELLENT = 0  # Green
+    GOOD = 1       # Cyan
+    MODERATE = 2   # Yellow
+    SLOW = 3       # Red
 
 
 @dataclass
@@ -36,7 +43,7 @@ class StreamingMetrics:
     
     engine_name: str
     model_name: str
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)
     first_token_time: Optional[float] = None
     last_token_time: Optional[float] = None
     tokens_received: int = 0
@@ -52,13 +59,44 @@ class StreamingMetrics:
     is_complete: bool = False
     error_message: Optional[str] = None
     
-    def record_token(self, token: str, timestamp: Optional[float] = None) -> None:
-        """Record a received token and update metrics."""
+    # (timestamp, tokens_received) at the most recent record_token calls
+    _window: "deque[Tuple[float, int]]" = field(
+        default_factory=lambda: deque(maxlen=16), init=False, repr=False, compare=False
+    )
+    
+    # Performance level memoized for the token rate it was classified at
+    _perf_cache: Optional[Tuple[float, PerformanceLevel]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def record_token(
+        self,
+        token: str,
+        timestamp: Optional[float] = None,
+        num_tokens: int = 1
+    ) -> None:
+        """
+        Record received tokens and update metrics.
+        
+        Args:
+            token: Token text (or the text of a multi-token chunk)
+            timestamp: time.monotonic() reading; taken now if None
+            num_tokens: Number of tokens the text represents
+        """
+        self._record(len(token), num_tokens, timestamp)
+    
+    def record_tokens(self, tokens: Sequence[str], timestamp: Optional[float] = None) -> None:
+        """Record a batch of tokens received together under one timestamp."""
+        if tokens:
+            self._record(sum(map(len, tokens)), len(tokens), timestamp)
+    
+    def _record(self, chars: int, count: int, timestamp: Optional[float]) -> None:
+        """Advance counters, latency and rates by count tokens of chars characters."""
         if timestamp is None:
-            timestamp = time.time()
+            timestamp = time.monotonic()
         
-        self.tokens_received += 1
-        self.total_chars += len(token)
+        self.tokens_received += count
+        self.total_chars += chars
         
         # Record first token time
         if self.first_token_time is None:
@@ -76,14 +114,27 @@ class StreamingMetrics:
         if elapsed > 0:
             self.average_token_rate = self.tokens_received / elapsed
         
-        # Current rate (based on last 10 tokens worth of time)
-        if self.tokens_received > 1 and self.first_token_time:
-            gen_elapsed = timestamp - self.first_token_time
-            if gen_elapsed > 0:
-                self.current_token_rate = (self.tokens_received - 1) / gen_elapsed
+        # Current rate over the sliding window of recent calls
+        window = self._window
+        window.append((timestamp, self.tokens_received))
+        if len(window) > 1:
+            oldest_time, oldest_count = window[0]
+            window_elapsed = timestamp - oldest_time
+            if window_elapsed > 0:
+                self.current_token_rate = (self.tokens_received - oldest_count) / window_elapsed
     
     def get_performance_level(self) -> PerformanceLevel:
         """Determine performance level based on current metrics."""
+        cached = self._perf_cache
+        if cached is not None and cached[0] == self.current_token_rate:
+            return cached[1]
+        
+        level = self._classify_performance()
+        self._perf_cache = (self.current_token_rate, level)
+        return level
+    
+    def _classify_performance(self) -> PerformanceLevel:
+        """Classify the current token rate into a performance level."""
         if self.current_token_rate == 0:
             return PerformanceLevel.MODERATE
         
@@ -97,12 +148,71 @@ class StreamingMetrics:
         else:
             return PerformanceLevel.SLOW
     
-    def get_elapsed_time(self) -> float:
-        """Get total elapsed time."""
-        end_time = self.last_token_time or time.time()
+    def get_elapsed_time(self, now: Optional[float] = None) -> float:
+        """Get total elapsed time, reading the clock only if now is not given."""
+        end_time = self.last_token_time or now or time.monotonic()
         return end_time - self.start_time
 
 
+@dataclass(slots=True)
+class _StreamTail:
+    """Last tokens of a stream with their joined text kept up to date incrementally."""
+    
+    tokens: "deque[str]"
+    count: int = 0
+    text: str = ""
+    text_count: int = 0
+    evicted_chars: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    
+    def append(self, token: str) -> None:
+        """Add one token, noting the characters of any evicted token."""
+        with self.lock:
+            tokens = self.tokens
+            if tokens and len(tokens) == tokens.maxlen:
+                self.evicted_chars += len(tokens[0])
+            tokens.append(token)
+            self.count += 1
+    
+    def extend(self, batch: Sequence[str]) -> None:
+        """Add a batch of tokens, noting the characters of any evicted tokens."""
+        with self.lock:
+            tokens = self.tokens
+            overflow = len(tokens) + len(batch) - tokens.maxlen
+            if overflow > 0:
+                self.evicted_chars += sum(map(len, islice(chain(tokens, batch), overflow)))
+            tokens.extend(batch)
+            self.count += len(batch)
+    
+    def get_text(self) -> str:
+        """Get the tail text, slicing off evicted characters and joining only new tokens."""
+        with self.lock:
+            added = self.count - self.text_count
+            if added:
+                tokens = self.tokens
+                if added >= len(tokens):
+                    self.text = "".join(tokens)
+                else:
+                    self.text = self.text[self.evicted_chars:] + "".join(
+                        islice(tokens, len(tokens) - added, None)
+                    )
+                self.text_count = self.count
+                self.evicted_chars = 0
+            return self.text
+
+
+@lru_cache(maxsize=4)
+def _stream_status(is_complete: bool, has_error: bool) -> Tuple[str, str, str]:
+    """Get the (icon, label, border style) shown for a stream's token panel."""
+    if has_error:
+        icon, label = "❌", "ERROR"
+    elif is_complete:
+        icon, label = "✅", "COMPLETE"
+    else:
+        icon, label = "🔴", "STREAMING"
+    return icon, label, "green" if is_complete else "cyan"
+
+
 class StreamConfig(BaseModel):
     """Configuration for streaming display."""
     
@@ -124,10 +234,34 @@ class StreamConfig(BaseModel):
         default=500,
         description="Maximum tokens to display (for very long responses)"
     )
+    max_buffered_streams: Optional[int] = Field(
+        default=None,
+        description="Completed streams whose full content is kept before the oldest are released (None keeps all)"
+    )
     update_interval: float = Field(
         default=0.1,
         description="Display update interval in seconds"
     )
+    plain_mode: Optional[bool] = Field(
+        default=None,
+        description="Print plain status lines instead of a live display (None uses plain output when not on a terminal)"
+    )
+    force_terminal: Optional[bool] = Field(
+        default=None,
+        description="Treat the console as a terminal (None detects it)"
+    )
+    color_system: Optional[Literal["auto", "standard", "256", "truecolor", "windows"]] = Field(
+        default="auto",
+        description="Console color system; pin it to skip color detection"
+    )
+    legacy_windows: Optional[bool] = Field(
+        default=None,
+        description="Use the legacy Windows console API (None detects it)"
+    )
+    highlight: bool = Field(
+        default=True,
+        description="Auto-highlight numbers and other patterns in plain strings"
+    )
     enable_syntax_highlighting: bool = Field(
         default=True,
         description="Enable syntax highlighting for code blocks"
@@ -150,7 +284,20 @@ class StreamingDisplay:
     performance indicators, and comparison capabilities.
     """
     
-    def __init__(self, config: Optional[StreamConfig] = None, console: Optional[Console] = None):
+    # Performance color coding, shared by every panel render
+    # Indexed by PerformanceLevel
+    _PERF_COLORS: ClassVar[Tuple[str, ...]] = ("green", "cyan", "yellow", "red")
+    
+    # Upper bound on cached comparison-table rate cells
+    _RATE_MARKUP_CACHE_SIZE: ClassVar[int] = 1024
+    
+    # Characters kept from each end of a released stream's content
+    _RELEASED_EDGE_CHARS: ClassVar[int] = 200
+    
+    # Longest a forced render waits for one already in flight (seconds)
+    _RENDER_WAIT: ClassVar[float] = 0.25
+    
+    def __init__(self, config: Optional[StreamConfig] = None, console: Optional["Console"] = None):
         """
         Initialize streaming display.
         
@@ -159,15 +306,53 @@ class StreamingDisplay:
             console: Rich console instance (creates new if None)
         """
         self.config = config or StreamConfig()
-        self.console = console or Console()
+        self._console = console
         
         # Active streams
         self.active_streams: Dict[str, StreamingMetrics] = {}
-        self.stream_content: Dict[str, List[str]] = {}
+        self.stream_content: Dict[str, io.StringIO] = {}
+        
+        # Completed streams whose content was reduced to a summary
+        self._released_streams: set = set()
+        
+        # Last max_display_tokens tokens per stream
+        self._stream_tails: Dict[str, _StreamTail] = {}
+        
+        # Comparison-table rate markup keyed by (color, rate in tenths)
+        self._rate_markup_cache: Dict[Tuple[str, str], str] = {}
+        
+        # Last comparison table with the per-stream state it was built from
+        self._comparison_table: Optional[Tuple[tuple, "Table"]] = None
+        self._comparison_rows: Dict[str, Tuple[tuple, Tuple[str, ...]]] = {}
         
         # Display state
         self.is_paused: bool = False
-        self.live_display: Optional[Live] = None
+        self.live_display: Optional["Live"] = None
+        
+        # Latest rendered frame; tokens only mark it dirty
+        self._dirty: bool = True
+        self._last_frame: Optional["Layout"] = None
+        self._last_frame_key: Optional[Tuple[Optional[str], bool]] = None
+        self._render_lock = threading.Lock()
+        self._render_pending: bool = False
+    
+    @property
+    def console(self) -> "Console":
+        """Rich console, created on first use unless one was passed in."""
+        if self._console is None:
+            from rich.console import Console
+            
+            self._console = Console(
+                force_terminal=self.config.force_terminal,
+                color_system=self.config.color_system,
+                legacy_windows=self.config.legacy_windows,
+                highlight=self.config.highlight
+            )
+        return self._console
+    
+    @console.setter
+    def console(self, console: "Console") -> None:
+        self._console = console
     
     def start_stream(
         self,
@@ -194,18 +379,27 @@ class StreamingDisplay:
         )
         
         self.active_streams[stream_id] = metrics
-        self.stream_content[stream_id] = []
+        self.stream_content[stream_id] = io.StringIO()
+        self._released_streams.discard(stream_id)
+        self._stream_tails[stream_id] = _StreamTail(deque(maxlen=self.config.max_display_tokens))
         
         return metrics
     
-    def add_token(self, engine_name: str, model_name: str, token: str) -> None:
+    def add_token(
+        self,
+        engine_name: str,
+        model_name: str,
+        token: str,
+        num_tokens: int = 1
+    ) -> None:
         """
         Add a token to the stream display.
         
         Args:
             engine_name: Name of the engine
             model_name: Name of the model
-            token: The token to add
+            token: The token to add (or a multi-token chunk)
+            num_tokens: Number of tokens the text represents
         """
         stream_id = f"{engine_name}:{model_name}"
         
@@ -213,10 +407,33 @@ class StreamingDisplay:
             return
         
         # Update metrics
-        self.active_streams[stream_id].record_token(token)
+        self.active_streams[stream_id].record_token(token, num_tokens=num_tokens)
         
         # Store content
-        self.stream_content[stream_id].append(token)
+        self.stream_content[stream_id].write(token)
+        self._stream_tails[stream_id].append(token)
+        self._dirty = True
+    
+    def add_tokens(self, engine_name: str, model_name: str, tokens: Sequence[str]) -> None:
+        """
+        Add a batch of tokens to the stream display.
+        
+        Args:
+            engine_name: Name of the engine
+            model_name: Name of the model
+            tokens: Tokens received together, e.g. from one SSE chunk
+        """
+        stream_id = f"{engine_name}:{model_name}"
+        
+        metrics = self.active_streams.get(stream_id)
+        if metrics is None or not tokens:
+            return
+        
+        metrics.record_tokens(tokens)
+        
+        self.stream_content[stream_id].writelines(tokens)
+        self._stream_tails[stream_id].extend(tokens)
+        self._dirty = True
     
     def complete_stream(self, engine_name: str, model_name: str) -> None:
         """Mark a stream as complete."""
@@ -224,6 +441,61 @@ class StreamingDisplay:
         
         if stream_id in self.active_streams:
             self.active_streams[stream_id].is_complete = True
+            self._dirty = True
+            self._enforce_buffer_limit()
+    
+    def release_content(self, engine_name: str, model_name: str) -> bool:
+        """
+        Reduce a completed stream's stored content to its first and last characters.
+        
+        The stream's metrics (including tokens_received) and its display tail
+        are kept, so it can still be rendered.
+        
+        Args:
+            engine_name: Name of the engine
+            model_name: Name of the model
+            
+        Returns:
+            True if the content was released
+        """
+        return self._release_stream(f"{engine_name}:{model_name}")
+    
+    def drain_completed(self) -> int:
+        """
+        Release the stored content of every completed stream.
+        
+        Returns:
+            Number of streams released
+        """
+        return sum(self._release_stream(stream_id) for stream_id in list(self.active_streams))
+    
+    def _release_stream(self, stream_id: str) -> bool:
+        """Replace a completed stream's content with a head/tail summary."""
+        metrics = self.active_streams.get(stream_id)
+        if metrics is None or not metrics.is_complete or stream_id in self._released_streams:
+            return False
+        
+        content = self.stream_content[stream_id].getvalue()
+        edge = self._RELEASED_EDGE_CHARS
+        if len(content) > 2 * edge:
+            content = f"{content[:edge]} ... {content[-edge:]}"
+        summary = self.stream_content[stream_id] = io.StringIO(content)
+        summary.seek(0, io.SEEK_END)
+        self._released_streams.add(stream_id)
+        return True
+    
+    def _enforce_buffer_limit(self) -> None:
+        """Release the oldest completed streams beyond max_buffered_streams."""
+        limit = self.config.max_buffered_streams
+        if limit is None:
+            return
+        
+        buffered = [
+            stream_id for stream_id, metrics in self.active_streams.items()
+            if metrics.is_complete and stream_id not in self._released_streams
+        ]
+        for stream_id in buffered[:max(len(buffered) - limit, 0)]:
+            self._release_stream(stream_id)
     
     def error_stream(self, engine_name: str, model_name: str, error: str) -> None:
         """Mark a stream as errored."""
@@ -232,57 +504,51 @@ class StreamingDisplay:
         if stream_id in self.active_streams:
             self.active_streams[stream_id].is_complete = True
             self.active_streams[stream_id].error_message = error
+            self._dirty = True
+            self._enforce_buffer_limit()
     
-    def _create_token_panel(self, stream_id: str) -> Panel:
+    def _create_token_panel(self, stream_id: str) -> "Panel":
         """Create the token streaming panel."""
-        metrics = self.active_streams[stream_id]
-        content = self.stream_content[stream_id]
-        
-        # Build display text
-        display_text = "".join(content)
+        from rich import box
+        from rich.panel import Panel
+        from rich.text import Text
         
-        # Truncate if too long
-        if len(content) > self.config.max_display_tokens:
-            display_text = "".join(content[-self.config.max_display_tokens:])
-            display_text = f"[dim]... (showing last {self.config.max_display_tokens} tokens)[/dim]\n\n" + display_text
+        metrics = self.active_streams[stream_id]
+        tail = self._stream_tails[stream_id]
         
-        # Create styled text
-        text = Text(display_text)
+        # Model output is appended as plain text (never parsed as markup)
+        # after a dimmed notice when older tokens were dropped
+        text = Text()
+        if tail.count > self.config.max_display_tokens:
+            text.append(f"... (showing last {self.config.max_display_tokens} tokens)\n\n", style="dim")
+        text.append(tail.get_text())
         
         # Add progress bar
         if not metrics.is_complete:
             text.append(f"\n\n{'━' * 40} {metrics.tokens_received} tokens")
         
         # Status indicator
-        status_icon = "🔴" if not metrics.is_complete else "✅"
-        status_text = "STREAMING" if not metrics.is_complete else "COMPLETE"
-        
-        if metrics.error_message:
-            status_icon = "❌"
-            status_text = "ERROR"
+        status_icon, status_text, border_style = _stream_status(
+            metrics.is_complete, bool(metrics.error_message)
+        )
         
         title = f"{status_icon} {status_text} | {metrics.engine_name} | {metrics.model_name}"
         
         return Panel(
             text,
             title=title,
-            border_style="cyan" if not metrics.is_complete else "green",
+            border_style=border_style,
             box=box.ROUNDED
         )
     
-    def _create_metrics_panel(self, stream_id: str) -> Panel:
+    def _create_metrics_panel(self, stream_id: str, now: Optional[float] = None) -> "Panel":
         """Create the live metrics panel."""
-        metrics = self.active_streams[stream_id]
-        perf_level = metrics.get_performance_level()
+        from rich import box
+        from rich.panel import Panel
+        from rich.text import Text
         
-        # Performance color coding
-        perf_colors = {
-            PerformanceLevel.EXCELLENT: "green",
-            PerformanceLevel.GOOD: "cyan",
-            PerformanceLevel.MODERATE: "yellow",
-            PerformanceLevel.SLOW: "red"
-        }
-        perf_color = perf_colors[perf_level]
+        metrics = self.active_streams[stream_id]
+        perf_color = self._PERF_COLORS[metrics.get_performance_level()]
         
         # Build metrics text
         metrics_text = Text()
@@ -297,7 +563,7 @@ class StreamingDisplay:
             metrics_text.append(f"TTFT: {metrics.ttft:.3f}s", style="bold blue")
         
         # Elapsed time
-        elapsed = metrics.get_elapsed_time()
+        elapsed = metrics.get_elapsed_time(now)
         metrics_text.append(" | ⏲️  ", style="bold")
         metrics_text.append(f"{elapsed:.1f}s", style="dim")
         
@@ -324,8 +590,12 @@ class StreamingDisplay:
             box=box.ROUNDED
         )
     
-    def _create_comparison_table(self) -> Table:
-        """Create side-by-side comparison table."""
+    @staticmethod
+    def _create_comparison_table_skeleton() -> "Table":
+        """Create the comparison table with its columns and no rows."""
+        from rich import box
+        from rich.table import Table
+        
         table = Table(
             title="🏁 Engine Comparison",
             box=box.ROUNDED,
@@ -339,33 +609,63 @@ class StreamingDisplay:
         table.add_column("TTFT", style="blue", justify="right")
         table.add_column("Status", justify="center")
         
-        for stream_id, metrics in self.active_streams.items():
-            perf_level = metrics.get_performance_level()
-            perf_colors = {
-                PerformanceLevel.EXCELLENT: "green",
-                PerformanceLevel.GOOD: "cyan",
-                PerformanceLevel.MODERATE: "yellow",
-                PerformanceLevel.SLOW: "red"
-            }
-            rate_color = perf_colors[perf_level]
-            
-            status = "✅" if metrics.is_complete else "🔄"
-            if metrics.error_message:
-                status = "❌"
-            
-            ttft_str = f"{metrics.ttft:.3f}s" if metrics.ttft else "..."
-            
-            table.add_row(
-                metrics.engine_name,
-                metrics.model_name,
-                str(metrics.tokens_received),
-                f"[{rate_color}]{metrics.current_token_rate:.1f}[/{rate_color}]",
-                ttft_str,
-                status
-            )
-        
         return table
     
+    def _create_comparison_table(self) -> "Table":
+        """Create side-by-side comparison table, reused while no row has changed."""
+        key = tuple(
+            (stream_id, self._frame_state(stream_id)) for stream_id in self.active_streams
+        )
+        cached = self._comparison_table
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        table = self._create_comparison_table_skeleton()
+        
+        # Only streams whose state moved are reformatted; finished streams
+        # keep the row they were last formatted with
+        rows = self._comparison_rows
+        for stream_id, state in key:
+            cached_row = rows.get(stream_id)
+            if cached_row is None or cached_row[0] != state:
+                cached_row = rows[stream_id] = (
+                    state, self._format_comparison_row(self.active_streams[stream_id])
+                )
+            table.add_row(*cached_row[1])
+        
+        self._comparison_table = (key, table)
+        return table
+    
+    def _format_comparison_row(self, metrics: StreamingMetrics) -> Tuple[str, ...]:
+        """Format one stream's comparison-table cells."""
+        rate_color = self._PERF_COLORS[metrics.get_performance_level()]
+        
+        status = "✅" if metrics.is_complete else "🔄"
+        if metrics.error_message:
+            status = "❌"
+        
+        ttft_str = f"{metrics.ttft:.3f}s" if metrics.ttft else "..."
+        
+        return (
+            metrics.engine_name,
+            metrics.model_name,
+            str(metrics.tokens_received),
+            self._get_rate_markup(rate_color, metrics.current_token_rate),
+            ttft_str,
+            status
+        )
+    
+    def _get_rate_markup(self, rate_color: str, rate: float) -> str:
+        """Return colored rate markup, cached per color and displayed rate."""
+        key = (rate_color, f"{rate:.1f}")
+        markup = self._rate_markup_cache.get(key)
+        if markup is None:
+            if len(self._rate_markup_cache) >= self._RATE_MARKUP_CACHE_SIZE:
+                self._rate_markup_cache.clear()
+            markup = f"[{rate_color}]{key[1]}[/{rate_color}]"
+            self._rate_markup_cache[key] = markup
+        return markup
+    
     def display_single_stream(
         self,
         engine_name: str,
@@ -383,22 +683,195 @@ class StreamingDisplay:
             show_metrics: Whether to show metrics panel
         """
         stream_id = f"{engine_name}:{model_name}"
+        self._run_live(stream_id, show_metrics, stream_callback)
+    
+    def _run_live(
+        self,
+        stream_id: Optional[str],
+        show_metrics: bool,
+        run: Callable[[], Any]
+    ) -> None:
+        """
+        Run a workload under one Live display of a stream or the comparison view.
+        
+        Args:
+            stream_id: Stream to display, or None for the comparison view
+            show_metrics: Whether to show metrics panel
+            run: Blocking function that feeds tokens into the display
+        """
+        if self._use_plain_mode():
+            self._run_plain(stream_id, run)
+            return
+        
+        from rich.live import Live
+        
+        self._dirty = True
+        
+        # A ticker thread refreshes the display every update_interval, but only
+        # when the visible state changed, while this thread only runs the
+        # workload; the layout is only rebuilt when tokens arrived
+        done = threading.Event()
+        
+        def refresh_on_change(live: "Live") -> None:
+            last_state = None
+            while not done.wait(self.config.update_interval):
+                state = self._display_state(stream_id)
+                if state != last_state and not self.is_paused:
+                    last_state = state
+                    live.refresh()
         
         with Live(
-            self._create_layout(stream_id, show_metrics),
             console=self.console,
-            refresh_per_second=int(1 / self.config.update_interval)
+            auto_refresh=False,
+            get_renderable=lambda: self._render_latest(stream_id, show_metrics)
         ) as live:
             self.live_display = live
+            ticker = threading.Thread(target=refresh_on_change, args=(live,), daemon=True)
+            ticker.start()
+            
+            try:
+                run()
+            finally:
+                done.set()
+                ticker.join()
             
-            # Run the streaming callback
-            stream_callback()
+            # Update one final time, waiting out any render in flight
+            self._dirty = True
+            self._render_latest(stream_id, show_metrics, wait=True)
+            live.refresh()
+    
+    def _use_plain_mode(self) -> bool:
+        """Whether to print plain status lines instead of a Live display."""
+        if self.config.plain_mode is not None:
+            return self.config.plain_mode
+        if self._console is not None:
+            return not self._console.is_terminal
+        return not sys.stdout.isatty()
+    
+    def _run_plain(self, stream_id: Optional[str], run: Callable[[], Any]) -> None:
+        """
+        Run a workload printing a status line per stream whenever it changes.
+        
+        Args:
+            stream_id: Stream to report, or None for every stream
+            run: Blocking function that feeds tokens into the display
+        """
+        out = self._console.file if self._console is not None else sys.stdout
+        last_states: Dict[str, Any] = {}
+        done = threading.Event()
+        
+        def report() -> None:
+            stream_ids = [stream_id] if stream_id is not None else list(self.active_streams)
+            for sid in stream_ids:
+                state = self._frame_state(sid)
+                if state is not None and state != last_states.get(sid):
+                    last_states[sid] = state
+                    print(self._plain_status(sid), file=out, flush=True)
+        
+        def report_on_change() -> None:
+            while not done.wait(self.config.update_interval):
+                if not self.is_paused:
+                    report()
+        
+        ticker = threading.Thread(target=report_on_change, daemon=True)
+        ticker.start()
+        try:
+            run()
+        finally:
+            done.set()
+            ticker.join()
+        report()
+    
+    def _plain_status(self, stream_id: str) -> str:
+        """Format one stream's metrics as a plain status line."""
+        metrics = self.active_streams[stream_id]
+        status = "error" if metrics.error_message else "complete" if metrics.is_complete else "streaming"
+        return (
+            f"{metrics.engine_name}/{metrics.model_name}: "
+            f"{metrics.current_token_rate:.1f} tok/s  {metrics.tokens_received} tokens  "
+            f"{metrics.get_elapsed_time():.1f}s  {status}"
+        )
+    
+    def _display_state(self, stream_id: Optional[str]) -> Any:
+        """Get the frame state of a stream, or of every stream for the comparison view."""
+        if stream_id is None:
+            return tuple(
+                (stream_id, self._frame_state(stream_id)) for stream_id in self.active_streams
+            )
+        return self._frame_state(stream_id)
+    
+    def _frame_state(self, stream_id: str) -> Optional[Tuple[int, bool, bool, int]]:
+        """Get the parts of a stream's metrics that change what is on screen."""
+        metrics = self.active_streams.get(stream_id)
+        if metrics is None:
+            return None
+        return (
+            metrics.tokens_received,
+            metrics.is_complete,
+            bool(metrics.error_message),
+            round(metrics.current_token_rate * 10)
+        )
+    
+    def _render_latest(
+        self,
+        stream_id: Optional[str],
+        show_metrics: bool = True,
+        wait: bool = False
+    ) -> "Layout":
+        """
+        Get the latest display frame, rebuilding it only when it is stale.
+        
+        Only one render runs at a time. A caller arriving mid-render gets the
+        previous frame and marks the render pending, so the renderer builds
+        once more from the newest data instead of callers queueing up.
+        
+        Args:
+            stream_id: Stream to render, or None for the comparison view
+            show_metrics: Whether to show metrics panel
+            wait: Wait up to _RENDER_WAIT for an in-flight render instead
+                of returning the previous frame
             
-            # Update one final time
-            live.update(self._create_layout(stream_id, show_metrics))
+        Returns:
+            The most recent layout for the stream
+        """
+        key = (stream_id, show_metrics)
+        frame = self._last_frame if self._last_frame_key == key else None
+        if frame is not None and (not self._dirty or self.is_paused):
+            return frame
+        
+        timeout = self._RENDER_WAIT if wait or frame is None else 0
+        if not self._render_lock.acquire(timeout=timeout):
+            self._render_pending = True
+            if frame is not None:
+                return frame
+            # Watchdog: never block the display behind a hung render
+            return self._create_layout(stream_id, show_metrics, time.monotonic())
+        
+        try:
+            while True:
+                self._dirty = False
+                self._render_pending = False
+                frame = self._create_layout(stream_id, show_metrics, time.monotonic())
+                if not self._render_pending:
+                    break
+            self._last_frame = frame
+            self._last_frame_key = key
+        finally:
+            self._render_lock.release()
+        return frame
     
-    def _create_layout(self, stream_id: str, show_metrics: bool = True) -> Layout:
-        """Create the display layout."""
+    def _create_layout(
+        self,
+        stream_id: Optional[str],
+        show_metrics: bool = True,
+        now: Optional[float] = None
+    ) -> "Layout":
+        """Create the display layout, timing every panel against one clock reading."""
+        from rich.layout import Layout
+        
+        if stream_id is None:
+            return self._create_comparison_layout()
+        
         layout = Layout()
         
         if show_metrics:
@@ -407,25 +880,60 @@ class StreamingDisplay:
                 Layout(name="metrics", size=3)
             )
             layout["tokens"].update(self._create_token_panel(stream_id))
-            layout["metrics"].update(self._create_metrics_panel(stream_id))
+            layout["metrics"].update(self._create_metrics_panel(stream_id, now))
         else:
             layout.update(self._create_token_panel(stream_id))
         
         return layout
     
+    def _create_comparison_layout(self) -> "Layout":
+        """Create the comparison table above side-by-side token panels."""
+        from rich.layout import Layout
+        
+        layout = Layout()
+        table = self._create_comparison_table()
+        
+        if not self.config.show_tokens or not self.active_streams:
+            layout.update(table)
+            return layout
+        
+        # Title, borders and header take five lines around the rows
+        layout.split_column(
+            Layout(table, name="table", size=len(self.active_streams) + 5),
+            Layout(name="streams")
+        )
+        layout["streams"].split_row(
+            *(Layout(self._create_token_panel(stream_id)) for stream_id in self.active_streams)
+        )
+        
+        return layout
+    
     def display_comparison(
         self,
-        stream_callbacks: List[Callable[[], None]]
+        stream_callbacks: List[Callable[[], Any]]
     ) -> None:
         """
         Display multiple streams for comparison.
         
+        All callbacks run concurrently on one asyncio event loop: coroutine
+        functions are awaited directly and plain callables run in the loop's
+        default executor. One Live display and one refresh ticker serve every
+        stream. Must be called outside a running event loop.
+        
         Args:
             stream_callbacks: List of callback functions for each stream
         """
-        # TODO: Implement multi-stream comparison
-        # This would show side-by-side streaming from multiple engines
-        pass
+        self._run_live(None, False, lambda: asyncio.run(self._run_callbacks(stream_callbacks)))
+    
+    @staticmethod
+    async def _run_callbacks(stream_callbacks: List[Callable[[], Any]]) -> None:
+        """Run stream callbacks concurrently until all of them finish."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            callback() if asyncio.iscoroutinefunction(callback)
+            else loop.run_in_executor(None, callback)
+            for callback in stream_callbacks
+        ))
     
     def pause(self) -> None:
         """Pause the display updates."""
@@ -444,4 +952,13 @@ class StreamingDisplay:
         """Clear all active streams."""
         self.active_streams.clear()
         self.stream_content.clear()
+        self._released_streams.clear()
+        self._stream_tails.clear()
+        self._rate_markup_cache.clear()
+        self._comparison_table = None
+        self._comparison_rows.clear()
+        self._last_frame = None
+        self._last_frame_key = None
+        self._render_pending = False
+        self._dirty = True
 
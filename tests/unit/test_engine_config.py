@@ -5,6 +5,15 @@ from pydantic import ValidationError
 from src.models.engine_config import EngineConfig, EngineHealthStatus, EngineInfo, ModelInfo, BenchmarkConfig
 
 
+# Valid EngineConfig fields that individual tests override
+_BASE_ENGINE_KWARGS = {
+    "name": "test",
+    "engine_type": "ollama",
+    "base_url": "http://localhost:8080",
+    "health_endpoint": "/health",
+}
+
+
 class TestEngineConfig:
     """Test cases for EngineConfig model."""
     
@@ -27,67 +36,36 @@ class TestEngineConfig:
     def test_invalid_engine_type(self):
         """Test that invalid engine types are rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            EngineConfig(
-                name="test",
-                engine_type="invalid",
-                base_url="http://localhost:8080",
-                health_endpoint="/health"
-            )
+            EngineConfig(**{**_BASE_ENGINE_KWARGS, "engine_type": "invalid"})
         
         assert "Input should be 'ollama', 'vllm' or 'tgi'" in str(exc_info.value)
     
     def test_invalid_url(self):
         """Test that invalid URLs are rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            EngineConfig(
-                name="test",
-                engine_type="ollama",
-                base_url="not-a-url",
-                health_endpoint="/health"
-            )
+            EngineConfig(**{**_BASE_ENGINE_KWARGS, "base_url": "not-a-url"})
         
         assert "URL" in str(exc_info.value)
     
-    def test_timeout_validation(self):
-        """Test timeout field validation."""
-        # Valid timeout
-        config = EngineConfig(
-            name="test",
-            engine_type="ollama",
-            base_url="http://localhost:8080",
-            health_endpoint="/health",
-            timeout=60
-        )
+    def test_timeout_valid(self):
+        """Test that a timeout within range is accepted."""
+        config = EngineConfig(**_BASE_ENGINE_KWARGS, timeout=60)
         assert config.timeout == 60
-        
-        # Invalid timeout (too low)
-        with pytest.raises(ValidationError):
-            EngineConfig(
-                name="test",
-                engine_type="ollama",
-                base_url="http://localhost:8080",
-                health_endpoint="/health",
-                timeout=0
-            )
-        
-        # Invalid timeout (too high)
+    
+    @pytest.mark.parametrize("timeout", [0, 4000], ids=["too_low", "too_high"])
+    def test_timeout_invalid(self, timeout):
+        """Test that out-of-range timeouts are rejected."""
         with pytest.raises(ValidationError):
-            EngineConfig(
-                name="test",
-                engine_type="ollama",
-                base_url="http://localhost:8080",
-                health_endpoint="/health",
-                timeout=4000
-            )
+            EngineConfig(**_BASE_ENGINE_KWARGS, timeout=timeout)
     
     def test_string_representation(self):
         """Test string representation of engine config."""
-        config = EngineConfig(
-            name="test-engine",
-            engine_type="vllm",
-            base_url="http://localhost:8000",
-            health_endpoint="/health"
-        )
+        config = EngineConfig(**{
+            **_BASE_ENGINE_KWARGS,
+            "name": "test-engine",
+            "engine_type": "vllm",
+            "base_url": "http://localhost:8000",
+        })
         
         expected = "test-engine (vllm) @ http://localhost:8000/"
         assert str(config) == expected
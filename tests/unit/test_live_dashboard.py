@@ -0,0 +1,61 @@
+"""Unit tests for live dashboard statistics."""
+
+import pytest
+from src.benchmarking.live_dashboard import EngineStats, LiveDashboard
+
+
+class TestEngineStats:
+    """Test cases for EngineStats incremental statistics."""
+    
+    def test_running_mean_tracks_appends(self):
+        """Test that the mean includes samples appended after a read."""
+        stats = EngineStats(ttft_values=[0.1, 0.3])
+        assert stats.get_avg_ttft() == pytest.approx(0.2)
+        
+        stats.ttft_values.append(0.5)
+        assert stats.get_avg_ttft() == pytest.approx(0.3)
+    
+    def test_running_mean_after_list_replaced(self):
+        """Test that replacing a sample list restarts the running mean."""
+        stats = EngineStats(ttft_values=[1.0, 1.0])
+        assert stats.get_avg_ttft() == pytest.approx(1.0)
+        
+        # Same length and longer replacements must not reuse the old sum
+        stats.ttft_values = [3.0, 5.0]
+        assert stats.get_avg_ttft() == pytest.approx(4.0)
+        
+        stats.ttft_values = [2.0, 2.0, 2.0]
+        assert stats.get_avg_ttft() == pytest.approx(2.0)
+    
+    def test_sample_percentile_after_list_replaced(self):
+        """Test that replacing a sample list rebuilds its sorted copy."""
+        stats = EngineStats(response_durations=[1.0, 2.0, 3.0])
+        assert stats.get_response_duration_p95() == 3.0
+        
+        # Same length and longer replacements must not reuse the old samples
+        for values in ([9.0, 7.0, 8.0], [0.5, 0.1, 0.4, 0.2]):
+            stats.response_durations = values
+            expected = stats.calculate_percentile(sorted(values), 95)
+            assert stats.get_response_duration_p95() == expected
+
+
+class TestLiveDashboard:
+    """Test cases for LiveDashboard statistics caching."""
+    
+    def test_engine_summary_not_reused_for_new_stats(self):
+        """Test that a new stats object with equal sample counts is recomputed."""
+        dashboard = LiveDashboard()
+        first = EngineStats(ttft_values=[1.0])
+        assert dashboard._get_engine_summary("ollama", first)[1] == pytest.approx(1.0)
+        
+        second = EngineStats(ttft_values=[3.0])
+        assert dashboard._get_engine_summary("ollama", second)[1] == pytest.approx(3.0)
+    
+    def test_start_run_clears_engine_summaries(self):
+        """Test that starting a run drops cached engine summaries."""
+        dashboard = LiveDashboard()
+        dashboard._get_engine_summary("ollama", EngineStats(ttft_values=[1.0]))
+        
+        dashboard.start_run()
+        
+        assert dashboard._engine_summaries == {}
@@ -11,6 +11,27 @@ from src.models.metrics import (
 )
 
 
+# Frozen timestamp for models whose timestamp value is irrelevant
+FIXED_NOW = datetime(2024, 1, 1)
+
+
+def _make_parsed(**overrides) -> ParsedMetrics:
+    """Build ParsedMetrics with test defaults, overridden by keyword.
+    
+    Uses model_construct() to skip validation; the validating constructor
+    is covered by TestParsedMetrics.
+    """
+    fields = {
+        "request_id": "test-123",
+        "engine_name": "test-engine",
+        "engine_type": "ollama",
+        "model_name": "llama2",
+        "timestamp": FIXED_NOW,
+        **overrides
+    }
+    return ParsedMetrics.model_construct(**fields)
+
+
 class TestRawEngineMetrics:
     """Test cases for RawEngineMetrics model."""
     
@@ -67,14 +88,12 @@ class TestParsedMetrics:
     
     def test_create_parsed_metrics(self):
         """Test creating parsed metrics."""
-        now = datetime.utcnow()
-        
         metrics = ParsedMetrics(
             request_id="test-123",
             engine_name="test-engine",
             engine_type="ollama",
             model_name="llama2",
-            timestamp=now,
+            timestamp=FIXED_NOW,
             prompt_eval_count=10,
             prompt_eval_duration=0.5,
             eval_count=5,
@@ -95,7 +114,7 @@ class TestParsedMetrics:
             engine_name="test-engine",
             engine_type="ollama",
             model_name="llama2",
-            timestamp=datetime.utcnow(),
+            timestamp=FIXED_NOW,
             prompt_eval_count=10,
             prompt_eval_duration=0.5,  # 0.5 seconds
             eval_count=5,
@@ -111,7 +130,7 @@ class TestParsedMetrics:
     
     def test_calculate_first_token_latency(self):
         """Test calculation of first token latency from timestamps."""
-        start_time = datetime.utcnow()
+        start_time = FIXED_NOW
         first_token_time = start_time + timedelta(milliseconds=150)
         
         metrics = ParsedMetrics(
@@ -135,7 +154,7 @@ class TestParsedMetrics:
             engine_name="test-engine",
             engine_type="ollama",
             model_name="llama2",
-            timestamp=datetime.utcnow(),
+            timestamp=FIXED_NOW,
             total_duration=1.5
         )
         
@@ -202,95 +221,47 @@ class TestMetricsCollection:
         collection.add_raw_metrics(raw_metrics)
         
         # Add parsed metrics
-        parsed_metrics = ParsedMetrics(
-            request_id="test-123",
-            engine_name="test-engine",
-            engine_type="ollama",
-            model_name="llama2",
-            timestamp=datetime.utcnow()
-        )
-        collection.add_parsed_metrics(parsed_metrics)
+        collection.add_parsed_metrics(_make_parsed())
         
         assert len(collection.raw_metrics) == 1
         assert len(collection.parsed_metrics) == 1
     
-    def test_get_metrics_by_engine(self):
-        """Test filtering metrics by engine."""
+    @pytest.mark.parametrize(
+        "filter_method,filter_args,field,expected",
+        [
+            ("get_metrics_by_engine", ("engine1",), "engine_name", "engine1"),
+            ("get_successful_metrics", (), "success", True),
+            ("get_failed_metrics", (), "success", False),
+        ],
+        ids=["by_engine", "successful", "failed"]
+    )
+    def test_filter_metrics(self, filter_method, filter_args, field, expected):
+        """Test filtering metrics by engine and success status."""
         collection = MetricsCollection()
-        
-        # Add metrics for different engines
-        metrics1 = ParsedMetrics(
+        collection.add_parsed_metrics(_make_parsed(
             request_id="test-1",
             engine_name="engine1",
-            engine_type="ollama",
-            model_name="llama2",
-            timestamp=datetime.utcnow()
-        )
-        metrics2 = ParsedMetrics(
+            success=True
+        ))
+        collection.add_parsed_metrics(_make_parsed(
             request_id="test-2",
             engine_name="engine2",
             engine_type="vllm",
-            model_name="llama2",
-            timestamp=datetime.utcnow()
-        )
-        
-        collection.add_parsed_metrics(metrics1)
-        collection.add_parsed_metrics(metrics2)
-        
-        engine1_metrics = collection.get_metrics_by_engine("engine1")
-        assert len(engine1_metrics) == 1
-        assert engine1_metrics[0].engine_name == "engine1"
-    
-    def test_get_successful_and_failed_metrics(self):
-        """Test filtering by success status."""
-        collection = MetricsCollection()
-        
-        # Add successful metrics
-        success_metrics = ParsedMetrics(
-            request_id="success-1",
-            engine_name="test-engine",
-            engine_type="ollama",
-            model_name="llama2",
-            timestamp=datetime.utcnow(),
-            success=True
-        )
-        
-        # Add failed metrics
-        failed_metrics = ParsedMetrics(
-            request_id="failed-1",
-            engine_name="test-engine",
-            engine_type="ollama",
-            model_name="llama2",
-            timestamp=datetime.utcnow(),
             success=False,
             error_message="Test error"
-        )
-        
-        collection.add_parsed_metrics(success_metrics)
-        collection.add_parsed_metrics(failed_metrics)
+        ))
         
-        successful = collection.get_successful_metrics()
-        failed = collection.get_failed_metrics()
+        filtered = getattr(collection, filter_method)(*filter_args)
         
-        assert len(successful) == 1
-        assert len(failed) == 1
-        assert successful[0].success is True
-        assert failed[0].success is False
+        assert len(filtered) == 1
+        assert getattr(filtered[0], field) == expected
     
     def test_export_summary(self):
         """Test exporting collection summary."""
         collection = MetricsCollection(description="Test collection")
         
         # Add some metrics
-        metrics = ParsedMetrics(
-            request_id="test-1",
-            engine_name="test-engine",
-            engine_type="ollama",
-            model_name="llama2",
-            timestamp=datetime.utcnow(),
-            success=True
-        )
-        collection.add_parsed_metrics(metrics)
+        collection.add_parsed_metrics(_make_parsed(request_id="test-1", success=True))
         
         summary = collection.export_summary()
         
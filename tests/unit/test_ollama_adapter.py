@@ -10,10 +10,14 @@ from src.adapters.ollama_adapter import OllamaAdapter
 from src.adapters.base_adapter import ConnectionError
 
 
+# Frozen request start; parse_metrics only copies it into the timestamp
+FIXED_NOW = datetime(2024, 1, 1)
+
+
 class TestOllamaAdapter:
     """Test cases for OllamaAdapter."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def engine_config(self):
         """Create a test Ollama engine configuration."""
         return EngineConfig(
@@ -25,12 +29,13 @@ class TestOllamaAdapter:
             timeout=30
         )
     
-    @pytest.fixture
+    # Shared: tests patch the request helpers, so the AsyncClient is never used
+    @pytest.fixture(scope="module")
     def adapter(self, engine_config):
         """Create a test Ollama adapter instance."""
         return OllamaAdapter(engine_config)
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_tags_response(self):
         """Mock response from /api/tags endpoint."""
         return {
@@ -57,7 +62,7 @@ class TestOllamaAdapter:
             ]
         }
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_generate_response(self):
         """Mock response from /api/generate endpoint."""
         return {
@@ -207,28 +212,33 @@ class TestOllamaAdapter:
             assert result.success is False
             assert "Network error" in result.error_message
     
-    def test_parse_metrics_success(self, adapter, mock_generate_response):
+    @pytest.fixture(scope="module")
+    def parsed_metrics_result(self, adapter, mock_generate_response):
+        """Parse the mock generate response once for the field checks."""
+        return adapter.parse_metrics(mock_generate_response, FIXED_NOW)
+    
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("engine_name", "test-ollama"),
+            ("engine_type", "ollama"),
+            ("model_name", "llama2:7b"),
+            ("success", True),
+            # Timing metrics are converted from nanoseconds to seconds
+            ("total_duration", pytest.approx(5.191566416, rel=1e-12)),
+            ("load_duration", pytest.approx(0.002154458, rel=1e-12)),
+            ("prompt_eval_count", 26),
+            ("prompt_eval_duration", pytest.approx(0.383809, rel=1e-12)),
+            ("eval_count", 298),
+            ("eval_duration", pytest.approx(4.799921, rel=1e-12)),
+            # Derived metrics
+            ("prompt_token_rate", pytest.approx(26 / 0.383809, rel=1e-3)),
+            ("response_token_rate", pytest.approx(298 / 4.799921, rel=1e-3)),
+        ]
+    )
+    def test_parse_metrics_success(self, parsed_metrics_result, attr, expected):
         """Test successful metrics parsing."""
-        request_start = datetime.utcnow()
-        
-        metrics = adapter.parse_metrics(mock_generate_response, request_start)
-        
-        assert metrics.engine_name == "test-ollama"
-        assert metrics.engine_type == "ollama"
-        assert metrics.model_name == "llama2:7b"
-        assert metrics.success is True
-        
-        # Check converted timing metrics (nanoseconds to seconds)
-        assert metrics.total_duration == pytest.approx(5.191566416, rel=1e-6)
-        assert metrics.load_duration == pytest.approx(0.002154458, rel=1e-6)
-        assert metrics.prompt_eval_count == 26
-        assert metrics.prompt_eval_duration == pytest.approx(0.383809, rel=1e-6)
-        assert metrics.eval_count == 298
-        assert metrics.eval_duration == pytest.approx(4.799921, rel=1e-6)
-        
-        # Check calculated derived metrics
-        assert metrics.prompt_token_rate == pytest.approx(26 / 0.383809, rel=1e-3)
-        assert metrics.response_token_rate == pytest.approx(298 / 4.799921, rel=1e-3)
+        assert getattr(parsed_metrics_result, attr) == expected
     
     def test_parse_metrics_minimal_response(self, adapter):
         """Test metrics parsing with minimal response data."""
@@ -236,7 +246,7 @@ class TestOllamaAdapter:
             "model": "test-model",
             "response": "test response"
         }
-        request_start = datetime.utcnow()
+        request_start = FIXED_NOW
         
         metrics = adapter.parse_metrics(minimal_response, request_start)
         
@@ -250,7 +260,7 @@ class TestOllamaAdapter:
     def test_parse_metrics_exception(self, adapter):
         """Test metrics parsing with exception."""
         invalid_response = None  # This will cause an exception
-        request_start = datetime.utcnow()
+        request_start = FIXED_NOW
         
         metrics = adapter.parse_metrics(invalid_response, request_start)
         